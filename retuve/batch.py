@@ -24,6 +24,7 @@ import os
 import shutil
 import time
 import traceback
+from functools import partial
 
 import torch
 
@@ -140,9 +141,15 @@ def run_batch(config: Config):
 
     torch.multiprocessing.set_start_method("spawn", force=True)
 
+    # Each worker reads and parses its own DICOM, so parsing already runs
+    # off the main process. Handing out one file at a time keeps every
+    # worker busy when some files take much longer than others.
     with multiprocessing.Pool(processes=config.batch.processes) as pool:
-        chunks = [(config, file, True) for file in all_files]
-        errors = pool.starmap(run_single, chunks)
+        errors = list(
+            pool.imap_unordered(
+                partial(run_single, config, for_batch=True), all_files, chunksize=1
+            )
+        )
 
     if any(error is not None for error in errors):
         already_processed = sum(
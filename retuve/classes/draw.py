@@ -17,9 +17,12 @@ Class for creating visual overlays on images.
 """
 
 from enum import Enum
-from typing import List, Literal, Tuple
+from functools import lru_cache
+from typing import List, Literal, Tuple, Union
 
+import cv2
 import numpy as np
+from numpy.typing import NDArray
 from PIL import Image, ImageDraw
 from radstract.data.colors import LabelColours
 
@@ -41,18 +44,11 @@ class DrawTypes(Enum):
     RECTANGLE = "rectangle"
 
     @classmethod
-    def ALL(cls) -> List["DrawTypes"]:
+    def ALL(cls) -> Tuple["DrawTypes", ...]:
         """
         Specified in order of drawing.
         """
-        return [
-            cls.SEGS,
-            cls.LINES,
-            cls.CIRCLE,
-            cls.RECTANGLE,
-            cls.POINTS,
-            cls.TEXT,
-        ]
+        return _DRAW_ORDER
 
     @classmethod
     def type_to_func(cls, draw, dtype):
@@ -64,18 +60,46 @@ class DrawTypes(Enum):
 
         :return: Function to use for a given overlay type.
         """
-        if dtype == cls.LINES:
-            return draw.line
-        elif dtype == cls.SEGS:
-            return draw.polygon
-        elif dtype == cls.TEXT:
-            return draw.text
-        elif dtype == cls.POINTS:
-            return draw.point
-        elif dtype == cls.CIRCLE:
-            return draw.ellipse
-        elif dtype == cls.RECTANGLE:
-            return draw.rectangle
+        return getattr(draw, _TYPE_TO_METHOD[dtype])
+
+
+# Built once, as these are looked up for every overlay and every operation.
+_DRAW_ORDER = (
+    DrawTypes.SEGS,
+    DrawTypes.LINES,
+    DrawTypes.CIRCLE,
+    DrawTypes.RECTANGLE,
+    DrawTypes.POINTS,
+    DrawTypes.TEXT,
+)
+
+_TYPE_TO_METHOD = {
+    DrawTypes.LINES: "line",
+    DrawTypes.SEGS: "polygon",
+    DrawTypes.TEXT: "text",
+    DrawTypes.POINTS: "point",
+    DrawTypes.CIRCLE: "ellipse",
+    DrawTypes.RECTANGLE: "rectangle",
+}
+
+# Operation types that can be drawn directly onto the array with OpenCV.
+_CV2_TYPES = frozenset((DrawTypes.SEGS, DrawTypes.RECTANGLE))
+
+# Text metrics do not depend on the canvas, so a 1x1 one is enough.
+_TEMP_DRAW = ImageDraw.Draw(Image.new("RGBA", (1, 1)))
+
+
+@lru_cache(maxsize=1024)
+def _text_bbox(font, text: str) -> Tuple[int, int, int, int]:
+    """
+    Get the bounding box of some text drawn at the origin.
+
+    :param font: Font to draw the text with.
+    :param text: Text to measure.
+
+    :return: Bounding box of the text, relative to the origin.
+    """
+    return _TEMP_DRAW.textbbox((0, 0), text, font=font)
 
 
 class Overlay:
@@ -91,15 +115,41 @@ class Overlay:
         :attr shape: Shape of the image to overlay on.
         :attr overlays: Dictionary of overlays.
         :attr config: Config object.
+        :attr color_table: The distinct colours used by the operations.
         """
         self.shape = (shape[0], shape[1], 4)
         self.config = config
         self.operations = {}
 
+        self.color_table = []
+        self._color_index = {}
+
         for drtype in DrawTypes.ALL():
             self.operations[drtype] = []
 
+    def _intern_color(self, color: Tuple[int, ...]) -> Tuple[int, ...]:
+        """
+        Get the shared copy of a colour from the colour table.
+
+        :param color: Colour to intern.
+
+        :return: The colour table entry equal to `color`.
+        """
+        index = self._color_index.get(color)
+        if index is None:
+            index = len(self.color_table)
+            self._color_index[color] = index
+            self.color_table.append(color)
+
+        return self.color_table[index]
+
     def add_operation(self, optype, *args, **kwargs):
+        # There are only a handful of distinct colours per frame,
+        # so let every operation share one tuple per colour.
+        for key in ("fill", "outline"):
+            if isinstance(kwargs.get(key), tuple):
+                kwargs[key] = self._intern_color(kwargs[key])
+
         # Store the drawing operation in the operations list
         self.operations[optype].append(((args, kwargs)))
 
@@ -108,23 +158,93 @@ class Overlay:
         if not any(self.operations.values()):
             return image
 
-        image = Image.fromarray(image)
+        if all(optype in _CV2_TYPES for optype, ops in self.operations.items() if ops):
+            return self._apply_cv2(image)
 
-        if image.mode != "RGBA":
-            image = image.convert("RGBA")
+        # Drawing without blending onto RGB gives the same colour channels
+        # as drawing onto RGBA, so skip the RGBA conversion and copy.
+        image = Image.fromarray(self._blend_segs(image))
         draw = ImageDraw.Draw(image)
 
         # Execute all stored operations
         # go in order of segs, lines, points, text
+        # segs have already been blended in above
         for optype in DrawTypes.ALL():
+            if optype == DrawTypes.SEGS:
+                continue
+
+            func = DrawTypes.type_to_func(draw, optype)
             for args, kwargs in self.operations[optype]:
-                func = DrawTypes.type_to_func(draw, optype)
                 func(*args, **kwargs)
 
-        final_image = np.array(image, dtype=np.uint8)
+        return np.array(image, dtype=np.uint8)
 
-        # remove alpha channel
-        final_image = final_image[:, :, :3]
+    def _apply_cv2(self, image: np.ndarray) -> np.ndarray:
+        """
+        Draw the stored operations with OpenCV, skipping the PIL RGBA
+        round trip. Only valid when all operations are in `_CV2_TYPES`.
+
+        :param image: Image to draw on.
+
+        :return: RGB copy of the image with the operations drawn.
+        """
+        final_image = self._blend_segs(image)
+
+        for args, kwargs in self.operations[DrawTypes.RECTANGLE]:
+            x1, y1, x2, y2 = (int(v) for v in np.reshape(args[0], -1))
+
+            if kwargs.get("fill") is not None:
+                bands = [((x1, y1), (x2, y2))]
+                color = kwargs["fill"]
+            else:
+                # PIL draws the outline inwards from the box edge
+                w = int(kwargs.get("width", 1))
+                bands = [
+                    ((x1, y1), (x2, y1 + w - 1)),
+                    ((x1, y2 - w + 1), (x2, y2)),
+                    ((x1, y1), (x1 + w - 1, y2)),
+                    ((x2 - w + 1, y1), (x2, y2)),
+                ]
+                color = kwargs["outline"]
+
+            for start, end in bands:
+                cv2.rectangle(final_image, start, end, color[:3], cv2.FILLED)
+
+        return final_image
+
+    def _blend_segs(self, image: np.ndarray) -> np.ndarray:
+        """
+        Alpha blend the stored segmentations onto an RGB copy of the image.
+
+        Each polygon is rasterised into a mask with PIL, so the edges match
+        `ImageDraw.polygon`, and only the masked pixels are blended, using
+        uint16 intermediates so the whole blend is a single vectorised
+        NumPy pass.
+
+        :param image: Image to draw on.
+
+        :return: RGB copy of the image with the segmentations blended in.
+        """
+        if image.ndim == 2:
+            final_image = cv2.cvtColor(image, cv2.COLOR_GRAY2RGB)
+        else:
+            final_image = np.array(image[:, :, :3], dtype=np.uint8)
+
+        if not self.operations[DrawTypes.SEGS]:
+            return final_image
+
+        height, width = final_image.shape[:2]
+
+        for args, kwargs in self.operations[DrawTypes.SEGS]:
+            *color, alpha = kwargs["fill"]
+
+            mask = Image.new("L", (width, height), 0)
+            ImageDraw.Draw(mask).polygon(args[0], fill=1)
+            region = np.asarray(mask, dtype=bool)
+
+            blended = final_image[region].astype(np.uint16) * (255 - alpha)
+            blended += np.array(color, dtype=np.uint16) * alpha
+            final_image[region] = (blended + 127) // 255
 
         return final_image
 
@@ -223,29 +343,38 @@ class Overlay:
         :param skel: List of points to draw the skeleton.
         """
 
-        for point in skel:
-            y, x = point
-            self.add_operation(
-                DrawTypes.POINTS,
-                (x, y),
-                fill=self.config.hip.midline_color.rgba(),
-            )
+        # Skeleton pixels are not ordered, so draw them as one batch of
+        # points rather than a polyline.
+        self.add_operation(
+            DrawTypes.POINTS,
+            [(x, y) for y, x in skel],
+            fill=self.config.hip.midline_color.rgba(),
+        )
 
-    def draw_lines(self, line_points: List[Tuple[Tuple[int, int], Tuple[int, int]]]):
+    def draw_lines(
+        self,
+        line_points: Union[
+            List[Tuple[Tuple[int, int], Tuple[int, int]]], NDArray[np.number]
+        ],
+    ):
         """
         Draws lines on the overlay.
 
-        :param line_points: List of tuples of points to draw lines between.
+        :param line_points: List of tuples of points to draw lines between,
+                            or an array of shape (N, 2, 2).
 
         """
+        color = self.config.visuals.line_color.rgba()
+        width = self.config.visuals.line_thickness
 
-        for point1, point2 in line_points:
-            self.add_operation(
-                DrawTypes.LINES,
-                (tuple(point1), tuple(point2)),
-                fill=self.config.visuals.line_color.rgba(),
-                width=self.config.visuals.line_thickness,
-            )
+        if isinstance(line_points, np.ndarray):
+            # Convert the whole array to (x1, y1, x2, y2) rows in one go
+            lines = map(tuple, line_points.reshape(-1, 4).tolist())
+        else:
+            lines = ((tuple(point1), tuple(point2)) for point1, point2 in line_points)
+
+        for line in lines:
+            self.add_operation(DrawTypes.LINES, line, fill=color, width=width)
 
     def draw_text(
         self,
@@ -270,9 +399,8 @@ class Overlay:
         elif header == "h2":
             font = self.config.visuals.font_h2
 
-        temp_draw = ImageDraw.Draw(Image.new("RGBA", self.shape[:2]))
-
-        bbox = temp_draw.textbbox((x1, y1), label_text, font=font)
+        left, top, right, bottom = _text_bbox(font, label_text)
+        bbox = (x1 + left, y1 + top, x1 + right, y1 + bottom)
 
         if grafs:
             color = self.config.visuals.graf_color.rgba()
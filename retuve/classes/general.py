@@ -16,6 +16,9 @@
 Other general classes that are used in the project.
 """
 
+import itertools
+from collections import defaultdict
+
 
 class RecordedError:
     """
@@ -24,18 +27,23 @@ class RecordedError:
     Can be critical or non-critical, and frame-dependent or not.
     """
 
+    __slots__ = ("errors", "frame_dependent_errors", "critical")
+
     def __init__(self):
         self.errors = []
-        self.frame_dependent_errors = {}
+        self.frame_dependent_errors = defaultdict(list)
         self.critical = False
 
     def __str__(self) -> str:
-        str_errors = self.errors.copy()
-
-        for frame_no, errors in self.frame_dependent_errors.items():
-            str_errors.append(f"Frame {frame_no}: {', '.join(errors)}")
-
-        return " ".join(str_errors)
+        return " ".join(
+            itertools.chain(
+                self.errors,
+                (
+                    f"Frame {frame_no}: {', '.join(errors)}"
+                    for frame_no, errors in self.frame_dependent_errors.items()
+                ),
+            )
+        )
 
     def append(self, error: str, frame_no: int = None):
         """
@@ -45,12 +53,10 @@ class RecordedError:
         :param frame_no: Frame number the error occurred on. (If required)
         """
 
-        if not frame_no:
+        if frame_no is None:
             self.errors.append(error)
 
         else:
-            if frame_no not in self.frame_dependent_errors:
-                self.frame_dependent_errors[frame_no] = []
             self.frame_dependent_errors[frame_no].append(error)
 
     def __bool__(self):
@@ -24,6 +24,8 @@ class Metric2D:
     2D Metrics just have a name and a value.
     """
 
+    __slots__ = ("name", "value")
+
     def __init__(self, name: str, value: Union[int, float]):
         """
         Initialize a 2D Metric.
@@ -43,6 +45,8 @@ class Metric3D:
     3D Metrics have a name and 4 values: Post, Graf, Ant, Full.
     """
 
+    __slots__ = ("name", "post", "graf", "ant", "full")
+
     def __init__(
         self,
         name: str,
@@ -34,8 +34,10 @@ retuve --task trak --keyphrase_file config.py
 ```
 """
 
+import copy
 from typing import Annotated, Iterable, List, Literal, Tuple, TypeVar
 
+import cv2
 import numpy as np
 import numpy.typing as npt
 from PIL import Image
@@ -56,6 +58,17 @@ class SegObject:
     Class for holding a single segmentation object.
     """
 
+    __slots__ = (
+        "points",
+        "cls",
+        "_mask",
+        "box",
+        "conf",
+        "empty",
+        "midline",
+        "midline_moved",
+    )
+
     def __init__(
         self,
         points: List[Tuple[int, int]] = None,
@@ -68,7 +81,7 @@ class SegObject:
         """
         :param points: List of points that make up the object.
         :param clss: Class of the object.
-        :param mask: Mask of the object.
+        :param mask: Mask of the object, either RGB or single channel.
         :param conf: Confidence of the object.
         :param box: Bounding box of the object.
         :param empty: Is the object empty.
@@ -101,8 +114,8 @@ class SegObject:
         if type(mask) != np.ndarray:
             raise ValueError("mask is not a numpy array")
 
-        # check mask shape
-        if len(mask.shape) != 3 or mask.shape[2] != 3:
+        # check mask shape, single channel masks are promoted to RGB on access
+        if mask.ndim != 2 and (mask.ndim != 3 or mask.shape[2] != 3):
             raise ValueError("mask is not RGB as required")
 
         colors = get_unique_colours(array=mask)
@@ -127,6 +140,56 @@ class SegObject:
         if conf is not None and not 0 <= conf <= 1:
             raise ValueError("conf is not None and not between 0 and 1")
 
+    @property
+    def mask(self) -> NDArrayImg_NxNx3_AllWhite:
+        """
+        RGB mask of the object.
+
+        Single channel masks are stored as given, so for those this
+        returns a new RGB copy on every read, and writing into it does
+        not change the object. Use `mask_2d` to read the stored mask
+        without a copy.
+        """
+        if self._mask is not None and self._mask.ndim == 2:
+            return cv2.cvtColor(self._mask, cv2.COLOR_GRAY2RGB)
+        return self._mask
+
+    @property
+    def mask_2d(self) -> np.ndarray:
+        """
+        Single channel 0/255 mask of the object.
+
+        This is a view of the stored mask, never a copy.
+        """
+        if self._mask is None or self._mask.ndim == 2:
+            return self._mask
+        return self._mask[:, :, 0]
+
+    @mask.setter
+    def mask(self, mask: NDArrayImg_NxNx3_AllWhite):
+        self._mask = mask
+
+    def __deepcopy__(self, memo: dict) -> "SegObject":
+        # Copy field by field, rather than through the generic reduce
+        # path, which deep copies every point tuple one at a time.
+        new = SegObject.__new__(SegObject)
+        memo[id(self)] = new
+
+        new.points = (
+            list(self.points)
+            if isinstance(self.points, list)
+            else copy.deepcopy(self.points, memo)
+        )
+        new.cls = self.cls
+        new._mask = None if self._mask is None else self._mask.copy()
+        new.box = self.box
+        new.conf = self.conf
+        new.empty = self.empty
+        new.midline = copy.deepcopy(self.midline, memo)
+        new.midline_moved = copy.deepcopy(self.midline_moved, memo)
+
+        return new
+
     def __str__(self):
         return f"SegObject({self.cls}, {self.conf}, {self.points})"
 
@@ -135,9 +198,11 @@ class SegObject:
         Returns the area of the object.
         """
         # Use the mask to calculate the area
-        if self.mask is None:
+        if self._mask is None:
             return 0
-        return np.sum(self.mask[:, :, 0] == 255)
+        if self._mask.ndim == 2:
+            return np.sum(self._mask == 255)
+        return np.sum(self._mask[:, :, 0] == 255)
 
     def flip_horizontally(self, img_width: int):
         """
@@ -167,8 +232,14 @@ class SegObject:
                 [(y, img_width - x) for y, x in self.midline_moved]
             )
 
-        if self.mask is not None:
-            self.mask = np.flip(self.mask, axis=1)
+        if self._mask is not None:
+            # Copy once here, rather than leaving a strided view for
+            # cv2 / PIL to copy on every later use.
+            self._mask = np.ascontiguousarray(self._mask[:, ::-1])
+
+
+# Empty objects are never mutated, so empty frames can all share one.
+_EMPTY_SEG_OBJECT = SegObject(empty=True)
 
 
 class SegFrameObjects:
@@ -176,6 +247,8 @@ class SegFrameObjects:
     Class for holding a frame of segmentation objects.
     """
 
+    __slots__ = ("seg_objects", "img")
+
     def __init__(self, img: NDArrayImg_NxNx3, seg_objects: list[SegObject] = None):
         """
         :param img: Image of the frame.
@@ -184,12 +257,18 @@ class SegFrameObjects:
         if type(img) != np.ndarray:
             raise ValueError("img is not a numpy array")
 
-        if seg_objects is None:
-            seg_objects = []
-
-        self.seg_objects = seg_objects
+        self.seg_objects = [] if seg_objects is None else seg_objects
         self.img = img
 
+    def __deepcopy__(self, memo: dict) -> "SegFrameObjects":
+        new = SegFrameObjects.__new__(SegFrameObjects)
+        memo[id(self)] = new
+
+        new.img = self.img.copy()
+        new.seg_objects = [copy.deepcopy(seg_obj, memo) for seg_obj in self.seg_objects]
+
+        return new
+
     def __iter__(self) -> Iterable[SegObject]:
         return iter(self.seg_objects)
 
@@ -213,7 +292,7 @@ class SegFrameObjects:
         :param img: Image of the frame.
         """
 
-        return cls(img=img, seg_objects=[SegObject(empty=True)])
+        return cls(img=img, seg_objects=[_EMPTY_SEG_OBJECT])
 
     def __str__(self):
         return f"SegFrameObjects({self.seg_objects})"
@@ -16,7 +16,6 @@
 Default Configs for Each Subconfig in the Keyphrases Module.
 """
 
-import torch
 from radstract.data.dicom import DicomTypes
 
 from retuve.keyphrases.config import Config
@@ -61,6 +60,7 @@ visuals = VisualsConfig(
     display_segs=False,
     min_vid_length=6,
     min_vid_fps=30,
+    table_backend="cv2",
 )
 
 hip = HipConfig(
@@ -90,6 +90,7 @@ hip = HipConfig(
     graf_selection_func_args={},
     display_graf_conf=False,
     graf_algo_threshold=None,
+    continue_on_no_metrics=True,
 )
 
 trak = TrakConfig(
@@ -127,7 +128,7 @@ base_config = Config(
     template=True,
     crop_coordinates=None,
     min_seg_confidence=0.6,
-    device=torch.device(0 if torch.cuda.is_available() else "cpu"),
+    device="auto",
     operation_type=OperationType.SEG,
     dev=False,
     replace_old=False,
@@ -20,17 +20,22 @@ Currently, all the defaults are manual methods.
 AI methods will be added in the future.
 """
 
+import os
 import time
-from typing import Dict, List, Tuple, Union
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import Dict, Iterator, List, Tuple, Union
 
 import cv2
+import nibabel as nib
 import numpy as np
 import pydicom
 from nibabel.nifti1 import Nifti1Image
 from PIL import Image, ImageOps
-from radstract.data.colors import LabelColours, get_unique_colours
+from radstract.data.colors import LabelColours, convert_labels_to_image
 from radstract.data.dicom import convert_dicom_to_images
-from radstract.data.nifti import convert_nifti_to_image_labels
+from radstract.data.images import crop_and_resize
 
 from retuve.classes.seg import SegFrameObjects, SegObject
 from retuve.hip_us.classes.enums import HipLabelsUS
@@ -38,12 +43,106 @@ from retuve.hip_xray.classes import HipLabelsXray, LandmarksXRay
 from retuve.keyphrases.config import Config
 from retuve.logs import log_timings
 
+# Approximations that keep every extreme point of a contour, so the
+# contours alone give the same bounding box as the full mask.
+_EXTREME_PRESERVING_APPROX = frozenset((cv2.CHAIN_APPROX_NONE, cv2.CHAIN_APPROX_SIMPLE))
+
+
+def _iter_nifti_labels(
+    seg: Union[str, Nifti1Image],
+    crop_coordinates: Tuple[int, int, int, int] = None,
+) -> Iterator[Image.Image]:
+    """
+    Lazily convert a NIfTI label volume to label colour images.
+
+    A streaming version of `convert_nifti_to_image_labels`, which reads
+    one slice at a time rather than loading the whole volume as float64.
+
+    :param seg: The Segmentation File
+    :param crop_coordinates: The Crop Coordinates
+
+    :return: The Label Images, one per frame
+    """
+    if isinstance(seg, str):
+        seg = nib.load(seg)
+
+    for i in range(seg.shape[2]):
+        slice_data = np.asarray(seg.dataobj[:, :, i], dtype=np.float64)
+
+        # RAI orientation to image orientation
+        slice_data = np.flipud(np.rot90(slice_data))
+
+        img = Image.fromarray(
+            convert_labels_to_image(slice_data).astype("uint8"), "RGB"
+        )
+
+        yield crop_and_resize(img, crop_coordinates, for_label=True)
+
+
+def _manual_seg_frame(
+    img: Image.Image,
+    result: Image.Image,
+    classes: Dict[Tuple[int, int, int], HipLabelsUS],
+    contour_approx: int,
+) -> Tuple[SegFrameObjects, float]:
+    """
+    Manual Segmentation for a single Hip Ultrasound frame.
+
+    :param img: The Image
+    :param result: The Label Image for the frame
+    :param classes: The Label Colours and their Classes
+    :param contour_approx: The OpenCV contour approximation method
+
+    :return: The Segmentation Results and the time taken
+    """
+    start = time.time()
+    img = np.array(img)
+
+    seg_frame_objects = SegFrameObjects(img)
+
+    result = np.asarray(result)
+
+    for colour, clss in classes.items():
+        # 0/255 mask of the pixels with exactly this label colour
+        mask = cv2.inRange(result, colour, colour)
+        if not cv2.countNonZero(mask):
+            continue
+
+        # get the bounding box
+        contours, _ = cv2.findContours(mask, cv2.RETR_EXTERNAL, contour_approx)
+
+        if not contours:
+            continue
+
+        if contour_approx in _EXTREME_PRESERVING_APPROX:
+            box = cv2.boundingRect(np.concatenate(contours))
+        else:
+            box = cv2.boundingRect(mask)
+        # just get the bottom left and top right coordinates
+        box = (box[0], box[1], box[0] + box[2], box[1] + box[3])
+
+        # get the points on the outside of the mask
+        points = contours[0].reshape(-1, 2)
+        points = list(map(tuple, points.tolist()))
+
+        seg_obj = SegObject(points, clss, mask, box=box, conf=1.0)
+
+        seg_frame_objects.append(seg_obj)
+
+    timing = time.time() - start
+
+    if len(seg_frame_objects) == 0:
+        seg_frame_objects = SegFrameObjects.empty(img=img)
+
+    return seg_frame_objects, timing
+
 
 def manual_predict_us_dcm(
     dcm: pydicom.FileDataset,
     keyphrase: Union[str, Config],
     config: Config = None,
     seg: Union[str, Nifti1Image] = None,
+    contour_approx: int = cv2.CHAIN_APPROX_TC89_KCOS,
 ) -> List[SegFrameObjects]:
     """
     Manual Segmentation for Hip Ultrasound.
@@ -52,6 +151,7 @@ def manual_predict_us_dcm(
     :param keyphrase: The Keyphrase or Config
     :param config: The Config
     :param seg: The Segmentation File
+    :param contour_approx: The OpenCV contour approximation method
 
     :return: The Segmentation Results
     """
@@ -64,7 +164,13 @@ def manual_predict_us_dcm(
         dicom_type=config.dicom_type,
     )
 
-    return manual_predict_us(dicom_images, keyphrase, config=config, seg=seg)
+    return manual_predict_us(
+        dicom_images,
+        keyphrase,
+        config=config,
+        seg=seg,
+        contour_approx=contour_approx,
+    )
 
 
 def manual_predict_us(
@@ -73,6 +179,7 @@ def manual_predict_us(
     config: Config = None,
     seg: Union[str, Nifti1Image] = None,
     seg_idx: int = 0,
+    contour_approx: int = cv2.CHAIN_APPROX_TC89_KCOS,
 ) -> List[SegFrameObjects]:
     """
     Manual Segmentation for Hip Ultrasound.
@@ -82,6 +189,7 @@ def manual_predict_us(
     :param config: The Config
     :param seg: The Segmentation File
     :param seg_idx: The Segmentation Index
+    :param contour_approx: The OpenCV contour approximation method
 
     :return: The Segmentation Results
     """
@@ -93,12 +201,10 @@ def manual_predict_us(
     if not seg:
         raise ValueError("seg file is required")
 
-    results, _ = convert_nifti_to_image_labels(
-        seg, crop_coordinates=config.crop_coordinates
-    )
+    results = _iter_nifti_labels(seg, crop_coordinates=config.crop_coordinates)
 
     if seg_idx:
-        results = results[seg_idx:]
+        results = islice(results, seg_idx, None)
 
     classes = {
         LabelColours.LABEL1: HipLabelsUS.IlliumAndAcetabulum,
@@ -106,62 +212,27 @@ def manual_predict_us(
         LabelColours.LABEL3: HipLabelsUS.OsIchium,
     }
 
-    timings = []
-    seg_results = []
-
-    for img, result in zip(images, results):
-        start = time.time()
-        img = np.array(img)
-
-        seg_frame_objects = SegFrameObjects(img)
-
-        # get each colour from the seg
-        unique_colours = get_unique_colours(result)
-
-        # convert image to np array
-        for colour in unique_colours:
-            if colour not in classes:
-                continue
-
-            # convert image to np array
-            result = np.array(result)
-
-            mask = np.all(result == colour, axis=-1)
-            mask = mask.astype(np.uint8) * 255
-
-            # get the bounding box
-            contours, _ = cv2.findContours(
-                mask, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE
+    # Frames are independent, and the per-frame work is mostly NumPy and
+    # OpenCV calls that release the GIL, so process them on a thread pool.
+    # executor.map() would read every label slice up front, so instead
+    # submit frames as they are decoded, and keep a bounded window of
+    # pending frames so only a few label slices are held at once.
+    # Collecting the futures in order keeps the results in frame order.
+    max_workers = os.cpu_count() or 1
+    frames = []
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending = deque()
+        for img, result in zip(images, results):
+            pending.append(
+                executor.submit(_manual_seg_frame, img, result, classes, contour_approx)
             )
+            if len(pending) >= 2 * max_workers:
+                frames.append(pending.popleft().result())
 
-            if not contours:
-                continue
-
-            box = cv2.boundingRect(mask)
-            # just get the bottom left and top right coordinates
-            box = (box[0], box[1], box[0] + box[2], box[1] + box[3])
-
-            # get the points on the outside of the mask
-            points = np.concatenate(contours[0], axis=0)
-
-            # drop 80% of the points
-            points = [
-                (int(x), int(y)) for i, (x, y) in enumerate(points) if i % 10 == 0
-            ]
+        frames.extend(future.result() for future in pending)
 
-            # convert mask to rgb
-            mask = cv2.cvtColor(mask, cv2.COLOR_GRAY2RGB)
-
-            seg_obj = SegObject(points, classes[colour], mask, box=box, conf=1.0)
-
-            seg_frame_objects.append(seg_obj)
-
-        timings.append(time.time() - start)
-
-        if len(seg_frame_objects) == 0:
-            seg_frame_objects = SegFrameObjects.empty(img=img)
-
-        seg_results.append(seg_frame_objects)
+    seg_results = [seg_frame_objects for seg_frame_objects, _ in frames]
+    timings = [timing for _, timing in frames]
 
     log_timings(timings, title="Manual Segmentation")
 
@@ -200,29 +271,33 @@ def manual_predict_xray(
     seg_results = []
 
     for image, landmarks in zip(images, landmark_list):
-        A, B = image.size
+        W, H = image.size
 
         if scale_landmarks:
             for key, (x, y) in landmarks.items():
                 landmarks[key] = (
-                    int(x * A / original_wh[0]),
-                    int(y * B / original_wh[1]),
+                    int(x * W / original_wh[0]),
+                    int(y * H / original_wh[1]),
                 )
 
         landmarks = LandmarksXRay(**landmarks)
         landmarks_l = [landmarks.pel_l_o, landmarks.pel_l_i, landmarks.fem_l]
         landmarks_r = [landmarks.pel_r_o, landmarks.pel_r_i, landmarks.fem_r]
 
-        # construct masks for the triangles
-        mask_l = np.zeros((A, B, 3), dtype=np.uint8)
-        mask_r = np.zeros((A, B, 3), dtype=np.uint8)
+        # convert both triangles in one go, for fillPoly and boundingRect
+        triangle_l, triangle_r = np.array([landmarks_l, landmarks_r], dtype=np.int32)
+
+        # construct single channel masks for the triangles, from a single
+        # allocation (the masks are kept by the SegObjects, so cannot be
+        # reused), SegObject promotes them to RGB only when read
+        mask_l, mask_r = np.zeros((2, H, W), dtype=np.uint8)
 
-        cv2.fillPoly(mask_l, [np.array(landmarks_l)], (255, 255, 255))
-        cv2.fillPoly(mask_r, [np.array(landmarks_r)], (255, 255, 255))
+        cv2.fillPoly(mask_l, [triangle_l], 255)
+        cv2.fillPoly(mask_r, [triangle_r], 255)
 
         # and bounding boxes
-        box_l = cv2.boundingRect(np.array(landmarks_l))
-        box_r = cv2.boundingRect(np.array(landmarks_r))
+        box_l = cv2.boundingRect(triangle_l)
+        box_r = cv2.boundingRect(triangle_r)
 
         # get the bottom left and top right coordinates
         box_l = (box_l[0], box_l[1], box_l[0] + box_l[2], box_l[1] + box_l[3])
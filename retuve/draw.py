@@ -20,8 +20,8 @@ General Drawing Functions used in the retuve package.
 import copy
 from typing import Union
 
+import cv2
 import numpy as np
-from PIL import Image, ImageOps
 
 from retuve.classes.draw import Overlay
 from retuve.classes.seg import SegFrameObjects
@@ -82,10 +82,42 @@ def draw_seg(
     return overlay
 
 
-def _calculate_new_coordinates(original_size, target_size, original_coords):
+def contain_size(width: int, height: int, target_size) -> tuple:
+    """
+    Get the largest size with the same aspect ratio that fits in
+    the target size, matching `PIL.ImageOps.contain`.
+
+    :param width: The width of the image.
+    :param height: The height of the image.
+    :param target_size: The (width, height) to fit the image in.
+
+    :return: The new (width, height).
+    """
+    target_width, target_height = target_size
+
+    image_ratio = width / height
+    target_ratio = target_width / target_height
+
+    if image_ratio > target_ratio:
+        return target_width, round(height / width * target_width)
+    elif image_ratio < target_ratio:
+        return round(width / height * target_height), target_height
+
+    return target_width, target_height
+
+
+def _compute_transform(original_size, target_size):
+    """
+    Compute the scale and padding that map coordinates from the
+    original image onto the resized display image.
+
+    :param original_size: The size of the original image.
+    :param target_size: The size of the resized image.
+
+    :return: The tuple (scale_x, scale_y, pad_x, pad_y).
+    """
     original_width, original_height = original_size
     target_width, target_height = target_size
-    original_x, original_y = original_coords
 
     # Calculate aspect ratios
     aspect_ratio_original = original_width / original_height
@@ -106,64 +138,79 @@ def _calculate_new_coordinates(original_size, target_size, original_coords):
     pad_x = (target_width - new_width) / 2
     pad_y = (target_height - new_height) / 2
 
-    # Adjust the original coordinates
-    new_x = original_x * scale_x + pad_x
-    new_y = original_y * scale_y + pad_y
+    return scale_x, scale_y, pad_x, pad_y
+
+
+def _transform_points(points, transform):
+    """
+    Apply a display transform to a set of points in one vectorised pass.
+
+    :param points: List of (x, y) tuples, or an array of shape (N, 2).
+    :param transform: The transform from `_compute_transform`.
+
+    :return: The transformed points, in the same container type.
+    """
+    if len(points) == 0:
+        return copy.copy(points)
+
+    scale_x, scale_y, pad_x, pad_y = transform
+
+    # a single fresh copy, transformed in place
+    new_points = np.array(points, dtype=np.float64)
+    new_points *= (scale_x, scale_y)
+    new_points += (pad_x, pad_y)
 
-    return new_x, new_y
+    if isinstance(points, np.ndarray):
+        return new_points.astype(points.dtype)
+
+    return list(map(tuple, new_points.tolist()))
 
 
 def resize_data_for_display(
     hip: Union[HipDataUS, HipDataXray], seg_frame_objs: SegFrameObjects
 ):
-    final_image = np.array(
-        ImageOps.contain(
-            Image.fromarray(seg_frame_objs.img),
-            TARGET_SIZE,
-            method=Image.NEAREST,
-        )
+    height, width = seg_frame_objs.img.shape[:2]
+    final_image = cv2.resize(
+        seg_frame_objs.img,
+        contain_size(width, height, TARGET_SIZE),
+        interpolation=cv2.INTER_NEAREST_EXACT,
     )
 
-    final_hip = copy.deepcopy(hip)
-    final_seg_frame_objs = copy.deepcopy(seg_frame_objs)
+    # The transform only depends on the sizes, so work it out once.
+    transform = _compute_transform(seg_frame_objs.img.shape[:2], final_image.shape[:2])
+    scale_x, scale_y, pad_x, pad_y = transform
+
+    # Only the coordinates are rewritten below, so copy just those
+    # rather than deep copying the masks and images along with them.
+    final_hip = copy.copy(hip)
+    final_hip.landmarks = copy.copy(hip.landmarks)
 
     if hip.landmarks:
         for name, landmark in final_hip.landmarks.items():
             if landmark is not None:
-                x, y = _calculate_new_coordinates(
-                    seg_frame_objs.img.shape[:2],
-                    final_image.shape[:2],
-                    landmark,
+                final_hip.landmarks[name] = (
+                    landmark[0] * scale_x + pad_x,
+                    landmark[1] * scale_y + pad_y,
                 )
-                final_hip.landmarks[name] = (x, y)
-
-    for seg_obj in final_seg_frame_objs:
-        if seg_obj.points is not None:
-            for i, point in enumerate(seg_obj.points):
-                x, y = _calculate_new_coordinates(
-                    seg_frame_objs.img.shape[:2],
-                    final_image.shape[:2],
-                    point,
-                )
-                seg_obj.points[i] = (x, y)
 
-            if seg_obj.midline is None:
-                continue
+    final_seg_objs = []
+    for seg_obj in seg_frame_objs:
+        seg_obj = copy.copy(seg_obj)
+        final_seg_objs.append(seg_obj)
 
-            for i, point in enumerate(seg_obj.midline):
-                x, y = _calculate_new_coordinates(
-                    seg_frame_objs.img.shape[:2],
-                    final_image.shape[:2],
-                    point,
-                )
-                seg_obj.midline[i] = (x, y)
+        if seg_obj.points is None:
+            continue
 
-            for i, point in enumerate(seg_obj.midline_moved):
-                x, y = _calculate_new_coordinates(
-                    seg_frame_objs.img.shape[:2],
-                    final_image.shape[:2],
-                    point,
-                )
-                seg_obj.midline_moved[i] = (x, y)
+        seg_obj.points = _transform_points(seg_obj.points, transform)
+
+        if seg_obj.midline is None:
+            continue
+
+        seg_obj.midline = _transform_points(seg_obj.midline, transform)
+        seg_obj.midline_moved = _transform_points(seg_obj.midline_moved, transform)
+
+    final_seg_frame_objs = SegFrameObjects(
+        img=seg_frame_objs.img, seg_objects=final_seg_objs
+    )
 
     return final_hip, final_seg_frame_objs, final_image
@@ -18,7 +18,8 @@ Contains the high-level functions that are used to run the Retuve pipeline.
 
 import copy
 import time
-from typing import Any, BinaryIO, Callable, Dict, List, Tuple, Union
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, BinaryIO, Callable, Dict, Iterable, Iterator, List, Tuple, Union
 
 import pydicom
 from moviepy.video.io.ImageSequenceClip import ImageSequenceClip
@@ -29,7 +30,7 @@ from radstract.data.nifti import NIFTI, convert_images_to_nifti_labels
 
 from retuve.classes.draw import Overlay
 from retuve.classes.metrics import Metric2D, Metric3D
-from retuve.classes.seg import SegFrameObjects
+from retuve.classes.seg import NDArrayImg_NxNx3, SegFrameObjects
 from retuve.hip_us.classes.dev import DevMetricsUS
 from retuve.hip_us.classes.general import HipDatasUS, HipDataUS
 from retuve.hip_us.draw import draw_hips_us, draw_table
@@ -64,13 +65,9 @@ def get_fps(no_of_frames: int, min_fps=30, min_vid_length=6) -> int:
     :return: The frames per second.
     """
 
-    fps = (
-        min_fps
-        if no_of_frames > (min_fps * min_vid_length)
-        else no_of_frames // min_vid_length
-    )
-
-    return fps if fps > 0 else 1
+    # Above min_fps * min_vid_length frames, the floor division is
+    # already at least min_fps, so clamping gives the same result.
+    return max(min(min_fps, no_of_frames // min_vid_length), 1)
 
 
 def process_landmarks_xray(
@@ -114,16 +111,26 @@ def process_segs_us(
 
     results: List[SegFrameObjects] = modes_func(file, config, **modes_func_kwargs_dict)
     results, shape = pre_process_segs_us(results, config)
-    pre_edited_results = copy.deepcopy(results)
+
+    # The snapshots are only used as test data, and deep copying
+    # every frame's masks is expensive, so only take them when needed.
+    if config.test_data_passthrough:
+        pre_edited_results = copy.deepcopy(results)
+
     landmarks, all_seg_rejection_reasons = segs_2_landmarks_us(results, config)
-    pre_edited_landmarks = copy.deepcopy(landmarks)
+
+    if config.test_data_passthrough:
+        pre_edited_landmarks = copy.deepcopy(landmarks)
+
     hip_datas = landmarks_2_metrics_us(landmarks, shape, config)
     hip_datas.all_seg_rejection_reasons = all_seg_rejection_reasons
 
     if config.test_data_passthrough:
+        # snapshot before attaching the other snapshots, so they
+        # are not deep copied a second time inside it
+        hip_datas.pre_edited_hip_datas = hip_datas.snapshot()
         hip_datas.pre_edited_results = pre_edited_results
         hip_datas.pre_edited_landmarks = pre_edited_landmarks
-        hip_datas.pre_edited_hip_datas = copy.deepcopy(hip_datas)
 
     return hip_datas, results, shape
 
@@ -136,7 +143,8 @@ def analyse_hip_xray_2D(
         Tuple[List[LandmarksXRay], List[SegFrameObjects]],
     ],
     modes_func_kwargs_dict: Dict[str, Any],
-) -> Tuple[HipDataXray, Image.Image, DevMetricsXRay]:
+    return_ndarray: bool = False,
+) -> Tuple[HipDataXray, Union[Image.Image, NDArrayImg_NxNx3], DevMetricsXRay]:
     """
     Analyze the hip for the xray.
 
@@ -144,13 +152,12 @@ def analyse_hip_xray_2D(
     :param keyphrase: The keyphrase.
     :param modes_func: The mode function.
     :param modes_func_kwargs_dict: The mode function kwargs.
+    :param return_ndarray: Return the image as a numpy array,
+                           rather than a PIL Image.
 
     :return: The hip, the image, and the dev metrics.
     """
-    if isinstance(keyphrase, str):
-        config = Config.get_config(keyphrase)
-    else:
-        config = keyphrase
+    config = Config.get_config(keyphrase)
 
     if config.operation_type in OperationType.LANDMARK:
         landmark_results, seg_results = modes_func(
@@ -161,7 +168,8 @@ def analyse_hip_xray_2D(
         )
 
     img = image_arrays[0]
-    img = Image.fromarray(img)
+    if not return_ndarray:
+        img = Image.fromarray(img)
     hip = hip_datas[0]
 
     if config.test_data_passthrough:
@@ -170,6 +178,33 @@ def analyse_hip_xray_2D(
     return hip, img, DevMetricsXRay()
 
 
+class _LazyVideoClip:
+    """
+    Stand-in for an ImageSequenceClip that only builds the clip
+    the first time it is used, so callers that never touch the
+    video do not pay for it.
+    """
+
+    def __init__(self, image_arrays: list, fps: int):
+        """
+        :param image_arrays: The frames of the video.
+        :param fps: The frames per second.
+        """
+        self._image_arrays = image_arrays
+        self._fps = fps
+        self._clip = None
+
+    def __getattr__(self, name: str) -> Any:
+        # Only called for attributes not set in __init__. Private names
+        # are not forwarded, so copy / pickle never recurse in here.
+        if name.startswith("_"):
+            raise AttributeError(name)
+
+        if self._clip is None:
+            self._clip = ImageSequenceClip(self._image_arrays, fps=self._fps)
+        return getattr(self._clip, name)
+
+
 def analyze_synthetic_xray(
     dcm: pydicom.FileDataset,
     keyphrase: Union[str, Config],
@@ -193,10 +228,7 @@ def analyze_synthetic_xray(
 
     :return: The nifti segmentation file
     """
-    if isinstance(keyphrase, str):
-        config = Config.get_config(keyphrase)
-    else:
-        config = keyphrase
+    config = Config.get_config(keyphrase)
 
     images = convert_dicom_to_images(dcm)
     nifti_frames = []
@@ -213,10 +245,15 @@ def analyze_synthetic_xray(
         ulogger.error(f"Critical Error: {e}")
         return None
 
+    # get_nifti_frame draws onto a fresh frame of the shape it is given,
+    # so a single overlay can serve every frame.
+    overlay = None
+
     for hip, seg_frame_objs in zip(hip_datas, seg_results):
         shape = seg_frame_objs.img.shape
 
-        overlay = Overlay((shape[0], shape[1], 3), config)
+        if overlay is None:
+            overlay = Overlay((shape[0], shape[1], 3), config)
         test = overlay.get_nifti_frame(seg_frame_objs, shape)
         nifti_frames.append(test)
 
@@ -249,6 +286,8 @@ def analyse_hip_3DUS(
     :param modes_func_kwargs_dict: The mode function kwargs.
 
     :return: The hip datas, the video clip, the 3D visual, and the dev metrics.
+             The video clip and 3D visual are None if no frame has metrics
+             and `config.hip.continue_on_no_metrics` is False.
     """
     start = time.time()
 
@@ -274,11 +313,17 @@ def analyse_hip_3DUS(
 
     hip_datas = handle_bad_frames(hip_datas, config)
 
+    hip_datas.file_id = file_id
+
     if not any(hip.metrics for hip in hip_datas):
         dcm_patient = dcm.get("PatientID", "Unknown")
         ulogger.error(f"No metrics were found in the DICOM {dcm_patient}.")
 
-    hip_datas.file_id = file_id
+        # Nothing to measure, so skip the 3D metrics and drawing
+        if not config.hip.continue_on_no_metrics:
+            hip_datas = get_dev_metrics(hip_datas, results, config)
+            return hip_datas, None, None, hip_datas.dev_metrics
+
     hip_datas = find_graf_plane(hip_datas, results, config=config)
 
     hip_datas, results = reverse_3dus_orientaition(
@@ -303,7 +348,7 @@ def analyse_hip_3DUS(
 
     hip_datas = get_dev_metrics(hip_datas, results, config)
 
-    data_image = draw_table(shape, hip_datas)
+    data_image = draw_table(shape, hip_datas, config)
     image_arrays.append(data_image)
 
     ulogger.info(f"Total 3DUS time: {time.time() - start:.2f}s")
@@ -314,10 +359,7 @@ def analyse_hip_3DUS(
         config.visuals.min_vid_length,
     )
 
-    video_clip = ImageSequenceClip(
-        image_arrays,
-        fps=fps,
-    )
+    video_clip = _LazyVideoClip(image_arrays, fps)
 
     if config.test_data_passthrough:
         hip_datas.illium_mesh = illium_mesh
@@ -345,7 +387,8 @@ def analyse_hip_2DUS(
     ],
     modes_func_kwargs_dict: Dict[str, Any],
     return_seg_info: bool = False,
-) -> Tuple[HipDataUS, Image.Image, DevMetricsUS]:
+    return_ndarray: bool = False,
+) -> Tuple[HipDataUS, Union[Image.Image, NDArrayImg_NxNx3], DevMetricsUS]:
     """
     Analyze a 2D Ultrasound Hip
 
@@ -353,6 +396,9 @@ def analyse_hip_2DUS(
     :param keyphrase: The keyphrase.
     :param modes_func: The mode function.
     :param modes_func_kwargs_dict: The mode function kwargs.
+    :param return_seg_info: Attach the segmentation results to the hip.
+    :param return_ndarray: Return the image as a numpy array,
+                           rather than a PIL Image.
 
     :return: The hip, the image, and the dev metrics.
     """
@@ -374,7 +420,8 @@ def analyse_hip_2DUS(
     image = image_arrays[0]
     hip = hip_datas[0]
 
-    image = Image.fromarray(image)
+    if not return_ndarray:
+        image = Image.fromarray(image)
 
     if return_seg_info:
         hip.seg_info = results
@@ -434,20 +481,19 @@ def analyse_hip_2DUS_sweep(
     hip_datas = get_dev_metrics(hip_datas, results, config)
 
     if graf_frame is not None:
-        graf_image = image_arrays[graf_frame]
-        graf_image = Image.fromarray(graf_image)
+        graf_array = image_arrays[graf_frame]
+        graf_image = Image.fromarray(graf_array)
 
-        image_arrays = (
-            [image_arrays[graf_frame]] * int(len(image_arrays) * 0.1)
-            + image_arrays
-            + [image_arrays[graf_frame]] * int(len(image_arrays) * 0.1)
-        )
+        # hold the graf frame either side of the sweep, padding with
+        # references to the one array and building the list only once
+        padding = [graf_array] * int(len(image_arrays) * 0.1)
+        image_arrays = [*padding, *image_arrays, *padding]
     else:
         graf_image = None
 
-    video_clip = ImageSequenceClip(
+    video_clip = _LazyVideoClip(
         image_arrays,
-        fps=get_fps(
+        get_fps(
             len(image_arrays),
             config.visuals.min_vid_fps,
             config.visuals.min_vid_length,
@@ -469,6 +515,8 @@ class RetuveResult:
     :attr visual_3d: The 3D visual, if any.
     """
 
+    __slots__ = ("hip_datas", "hip", "image", "metrics", "video_clip", "visual_3d")
+
     def __init__(
         self,
         metrics: Union[List[Metric2D], List[Metric3D]],
@@ -486,6 +534,77 @@ class RetuveResult:
         self.visual_3d = visual_3d
 
 
+def _run_xray(config, modes_func, modes_func_kwargs_dict, file) -> RetuveResult:
+    file = Image.open(file)
+    hip, image, dev_metrics = analyse_hip_xray_2D(
+        file, config, modes_func, modes_func_kwargs_dict
+    )
+    return RetuveResult(hip.json_dump(config, dev_metrics), image=image, hip=hip)
+
+
+def _run_us3d(config, modes_func, modes_func_kwargs_dict, file) -> RetuveResult:
+    hip_datas, video_clip, visual_3d, dev_metrics = analyse_hip_3DUS(
+        file, config, modes_func, modes_func_kwargs_dict
+    )
+    return RetuveResult(
+        hip_datas.json_dump(config),
+        hip_datas=hip_datas,
+        video_clip=video_clip,
+        visual_3d=visual_3d,
+    )
+
+
+def _run_us2d(config, modes_func, modes_func_kwargs_dict, file) -> RetuveResult:
+    file = Image.open(file).convert("RGB")
+    hip, image, dev_metrics = analyse_hip_2DUS(
+        file, config, modes_func, modes_func_kwargs_dict
+    )
+    return RetuveResult(hip.json_dump(config, dev_metrics), hip=hip, image=image)
+
+
+def _run_us2dsw(config, modes_func, modes_func_kwargs_dict, file) -> RetuveResult:
+    hip, image, dev_metrics, video_clip = analyse_hip_2DUS_sweep(
+        file, config, modes_func, modes_func_kwargs_dict
+    )
+    json_dump = None
+    if hip:
+        json_dump = hip.json_dump(config, dev_metrics)
+
+    return RetuveResult(
+        json_dump,
+        hip=hip,
+        image=image,
+        video_clip=video_clip,
+    )
+
+
+_RUNNERS: Dict[HipMode, Callable[..., RetuveResult]] = {
+    HipMode.XRAY: _run_xray,
+    HipMode.US3D: _run_us3d,
+    HipMode.US2D: _run_us2d,
+    HipMode.US2DSW: _run_us2dsw,
+}
+
+
+def _read_input(config: Config, file: str) -> Union[str, pydicom.FileDataset]:
+    """
+    Read the file as a DICOM, if the config says it is one.
+
+    :param config: The configuration.
+    :param file: The file.
+
+    :return: The DICOM dataset, or the file unchanged.
+    """
+    always_dcm = (
+        len(config.batch.input_types) == 1 and ".dcm" in config.batch.input_types
+    )
+
+    if always_dcm or (file.endswith(".dcm") and ".dcm" in config.batch.input_types):
+        return pydicom.dcmread(file)
+
+    return file
+
+
 def retuve_run(
     hip_mode: HipMode,
     config: Config,
@@ -504,48 +623,52 @@ def retuve_run(
 
     :return: The Retuve result standardised output.
     """
-    always_dcm = (
-        len(config.batch.input_types) == 1 and ".dcm" in config.batch.input_types
-    )
+    runner = _RUNNERS.get(hip_mode)
+    if runner is None:
+        raise ValueError(f"Invalid hip_mode. {hip_mode}")
 
-    if always_dcm or (file.endswith(".dcm") and ".dcm" in config.batch.input_types):
-        file = pydicom.dcmread(file)
+    file = _read_input(config, file)
 
-    if hip_mode == HipMode.XRAY:
-        file = Image.open(file)
-        hip, image, dev_metrics = analyse_hip_xray_2D(
-            file, config, modes_func, modes_func_kwargs_dict
-        )
-        return RetuveResult(hip.json_dump(config, dev_metrics), image=image, hip=hip)
-    elif hip_mode == HipMode.US3D:
-        hip_datas, video_clip, visual_3d, dev_metrics = analyse_hip_3DUS(
-            file, config, modes_func, modes_func_kwargs_dict
-        )
-        return RetuveResult(
-            hip_datas.json_dump(config),
-            hip_datas=hip_datas,
-            video_clip=video_clip,
-            visual_3d=visual_3d,
-        )
-    elif hip_mode == HipMode.US2D:
-        file = Image.open(file).convert("RGB")
-        hip, image, dev_metrics = analyse_hip_2DUS(
-            file, config, modes_func, modes_func_kwargs_dict
-        )
-        return RetuveResult(hip.json_dump(config, dev_metrics), hip=hip, image=image)
-    elif hip_mode == HipMode.US2DSW:
-        hip, image, dev_metrics, video_clip = analyse_hip_2DUS_sweep(
-            file, config, modes_func, modes_func_kwargs_dict
-        )
-        json_dump = None
-        if hip:
-            json_dump = hip.json_dump(config, dev_metrics)
-
-        return RetuveResult(
-            json_dump,
-            hip=hip,
-            image=image,
-            video_clip=video_clip,
-        )
-    else:
+    return runner(config, modes_func, modes_func_kwargs_dict, file)
+
+
+def retuve_run_stream(
+    hip_mode: HipMode,
+    config: Config,
+    modes_func: GeneralModeFuncType,
+    modes_func_kwargs_dict: Dict[str, Any],
+    files: Iterable[str],
+) -> Iterator[RetuveResult]:
+    """
+    Run the Retuve pipeline over many files, reading the next DICOM
+    on a background thread while the current file is analysed.
+
+    :param hip_mode: The hip mode.
+    :param config: The configuration.
+    :param modes_func: The mode function.
+    :param modes_func_kwargs_dict: The mode function kwargs.
+    :param files: The files.
+
+    :return: The Retuve result standardised output, for each file in order.
+    """
+    runner = _RUNNERS.get(hip_mode)
+    if runner is None:
         raise ValueError(f"Invalid hip_mode. {hip_mode}")
+
+    # Reading is mostly disk I/O, which releases the GIL, so one
+    # reader thread keeps a single file ahead of the analysis.
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        pending = None
+
+        for file in files:
+            upcoming = executor.submit(_read_input, config, file)
+
+            if pending is not None:
+                yield runner(
+                    config, modes_func, modes_func_kwargs_dict, pending.result()
+                )
+
+            pending = upcoming
+
+        if pending is not None:
+            yield runner(config, modes_func, modes_func_kwargs_dict, pending.result())
@@ -18,8 +18,22 @@ Developer metrics for Ultrasound Analysis
 
 from typing import Dict, List
 
+import numpy as np
+
 
 class DevMetricsUS:
+    __slots__ = (
+        "os_ichium_detected",
+        "no_frames_segmented",
+        "no_frames_marked",
+        "graf_frame",
+        "acetabular_mid_frame",
+        "fem_mid_frame",
+        "critial_error",
+        "cr_points",
+        "total_frames",
+    )
+
     def __init__(self):
         """
         Class to store the metrics of the development of the US segmentation
@@ -94,3 +108,69 @@ class DevMetricsUS:
             "cr_points": self.cr_points,
             "total_frames": self.total_frames,
         }
+
+
+class DevMetricsUSBatch:
+    """
+    Struct of arrays view over many DevMetricsUS objects.
+
+    Useful for summarising the development metrics of a whole dataset
+    with vectorised NumPy reductions, rather than looping in Python.
+    """
+
+    __slots__ = (
+        "os_ichium_detected",
+        "no_frames_segmented",
+        "no_frames_marked",
+        "graf_frame",
+        "acetabular_mid_frame",
+        "fem_mid_frame",
+        "critial_error",
+        "total_frames",
+    )
+
+    _BOOL_FIELDS = ("os_ichium_detected", "critial_error")
+
+    def __init__(self, dev_metrics_list: List[DevMetricsUS]):
+        """
+        :param dev_metrics_list: List of DevMetricsUS objects.
+
+        :attr <field>: np.ndarray: One entry per DevMetricsUS, for each
+              scalar field of DevMetricsUS, with None stored as 0
+              (cr_points is not included).
+        """
+        count = len(dev_metrics_list)
+
+        for field in self.__slots__:
+            dtype = bool if field in self._BOOL_FIELDS else np.int64
+            setattr(
+                self,
+                field,
+                np.fromiter(
+                    (getattr(dev, field) or 0 for dev in dev_metrics_list),
+                    dtype=dtype,
+                    count=count,
+                ),
+            )
+
+    def __len__(self) -> int:
+        return len(self.total_frames)
+
+    def summary(self) -> Dict[str, float]:
+        """
+        Summarise the batch of development metrics.
+
+        :return: Dictionary of the summary statistics
+        """
+        if len(self) == 0:
+            return {}
+
+        return {
+            "count": len(self),
+            "os_ichium_detected": int(np.count_nonzero(self.os_ichium_detected)),
+            "critial_error": int(np.count_nonzero(self.critial_error)),
+            "mean_no_frames_segmented": float(self.no_frames_segmented.mean()),
+            "mean_no_frames_marked": float(self.no_frames_marked.mean()),
+            "mean_total_frames": float(self.total_frames.mean()),
+            "total_frames": int(self.total_frames.sum()),
+        }
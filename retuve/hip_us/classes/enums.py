@@ -37,19 +37,19 @@ class Side(Enum):
         """
         return [Side.POST, Side.ANT, Side.GRAF]
 
-    @classmethod
-    def get_name(cls, side: "Side") -> str:
+    @staticmethod
+    def get_name(side: "Side") -> str:
         """
         Return the full name of the side from the abbreviation.
         """
-        if side == Side.ANT:
-            return "Anterior"
-        elif side == Side.POST:
-            return "Posterior"
-        elif side == Side.GRAF:
-            return "Central"
-        else:
-            return "Unknown"
+        return _SIDE_NAMES.get(side, "Unknown")
+
+
+_SIDE_NAMES = {
+    Side.ANT: "Anterior",
+    Side.POST: "Posterior",
+    Side.GRAF: "Central",
+}
 
 
 class HipLabelsUS(Enum):
@@ -61,17 +61,16 @@ class HipLabelsUS(Enum):
     FemoralHead = 1
     OsIchium = 2
 
-    @classmethod
-    def get_name(cls, label: "HipLabelsUS") -> str:
+    @staticmethod
+    def get_name(label: "HipLabelsUS") -> str:
         """
         Return the full name of the label from the abbreviation.
         """
+        return _HIP_LABEL_US_NAMES.get(label, "Unknown")
+
 
-        if label == HipLabelsUS.IlliumAndAcetabulum:
-            return "Illium and Acetabulum"
-        elif label == HipLabelsUS.FemoralHead:
-            return "Femoral Head"
-        elif label == HipLabelsUS.OsIchium:
-            return "Os Ichium"
-        else:
-            return "Unknown"
+_HIP_LABEL_US_NAMES = {
+    HipLabelsUS.IlliumAndAcetabulum: "Illium and Acetabulum",
+    HipLabelsUS.FemoralHead: "Femoral Head",
+    HipLabelsUS.OsIchium: "Os Ichium",
+}
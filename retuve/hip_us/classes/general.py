@@ -16,8 +16,10 @@
 Contains the Hip Data Classes and the Landmarks Class.
 """
 
+import copy
 from typing import Dict, List, Tuple, Union
 
+import numpy as np
 from moviepy.video.io.ImageSequenceClip import ImageSequenceClip
 from plotly.graph_objs import Figure
 from radstract.data.nifti import NIFTI
@@ -43,6 +45,8 @@ class LandmarksUS:
     :attr mid_cov_point: tuple: Mid cov point landmark
     """
 
+    __slots__ = ("left", "right", "apex", "point_D", "point_d", "mid_cov_point")
+
     def __init__(
         self,
         left: Tuple[int, int] = None,
@@ -113,8 +117,12 @@ class HipDataUS:
     :attr metrics: List[Metric2D]: List of 2D Metrics.
     :attr frame_no: int: Frame number of the Hip Image.
     :attr side: Side: Side of the Hip Image.
+    :attr seg_info: List[SegFrameObjects]: Segmentation results, only set
+          when requested from analyse_hip_2DUS.
     """
 
+    __slots__ = ("landmarks", "metrics", "frame_no", "side", "seg_info")
+
     def __init__(
         self,
         landmarks: LandmarksUS = None,
@@ -155,6 +163,21 @@ class HipDataUS:
                 return metric.value
         return 0
 
+    def snapshot(self) -> "HipDataUS":
+        """
+        Returns a copy that is unaffected by later changes to this Hip Data.
+
+        The landmarks and metrics list are copied, the metrics
+        themselves are shared as they are not changed once calculated.
+        """
+        snapshot = copy.copy(self)
+        if self.landmarks is not None:
+            snapshot.landmarks = copy.copy(self.landmarks)
+        if self.metrics is not None:
+            snapshot.metrics = list(self.metrics)
+
+        return snapshot
+
     def json_dump(self, config: Config, dev_metrics: DevMetricsUS):
         """
         Returns a dictionary of the Hip Data in JSON format.
@@ -232,6 +255,54 @@ class HipDatasUS:
         """
         self.hip_datas.append(hip_data)
 
+    def snapshot(self) -> "HipDatasUS":
+        """
+        Returns a copy that is unaffected by later changes to these Hip Datas.
+
+        A cheaper alternative to copy.deepcopy, which only copies
+        the containers and objects that are changed later on.
+        """
+        snapshot = copy.copy(self)
+        snapshot.hip_datas = [hip_data.snapshot() for hip_data in self.hip_datas]
+        snapshot.metrics = list(self.metrics)
+        snapshot.cr_points = list(self.cr_points)
+        snapshot.recorded_error = copy.deepcopy(self.recorded_error)
+
+        return snapshot
+
+    def metric_values(self, names: List[str]) -> np.ndarray:
+        """
+        Returns the 2D metric values of every Hip Data as a single array.
+
+        :param names: Names of the metrics to get.
+
+        :return: Array of shape (no. of hip datas, no. of names),
+                 with 0 for any missing metrics.
+        """
+        index = {name: i for i, name in enumerate(names)}
+        values = np.zeros((len(self.hip_datas), len(names)), dtype=np.float64)
+
+        for row, hip_data in zip(values, self.hip_datas):
+            # reversed so the first metric with a name wins, as in get_metric
+            for metric in reversed(hip_data.metrics or ()):
+                i = index.get(metric.name)
+                if i is not None:
+                    row[i] = metric.value
+
+        return values
+
+    def marked_mask(self) -> np.ndarray:
+        """
+        Returns whether each Hip Data has any non-zero metrics.
+
+        :return: Boolean array with one entry per Hip Data.
+        """
+        return np.fromiter(
+            (hip_data.marked() for hip_data in self.hip_datas),
+            dtype=bool,
+            count=len(self.hip_datas),
+        )
+
     def sorted_metrics(self) -> List[Metric3D]:
         """
         Returns the metrics sorted by name.
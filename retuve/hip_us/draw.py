@@ -17,20 +17,30 @@ All unique drawing functions for Hip Ultrasound
 """
 
 import io
+import os
 import textwrap
 import time
-from typing import List, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Dict, List, Tuple
 
 import cv2
+import nibabel as nib
 import numpy as np
 import plotly.graph_objects as go
 from attr import has
-from PIL import Image, ImageOps
-from radstract.data.nifti import NIFTI, convert_images_to_nifti_labels
+from PIL import Image, ImageDraw
+from radstract.data.nifti import NIFTI, NIFTI_Types
 
 from retuve.classes.draw import Overlay
 from retuve.classes.seg import SegFrameObjects
-from retuve.draw import TARGET_SIZE, draw_landmarks, draw_seg, resize_data_for_display
+from retuve.draw import (
+    TARGET_SIZE,
+    contain_size,
+    draw_landmarks,
+    draw_seg,
+    resize_data_for_display,
+)
 from retuve.hip_us.classes.enums import Side
 from retuve.hip_us.classes.general import HipDatasUS, HipDataUS
 from retuve.hip_us.handlers.side import get_side_metainfo
@@ -64,6 +74,125 @@ def draw_fem_head(
     return overlay
 
 
+def _draw_hip_us(
+    hip: HipDataUS,
+    seg_frame_objs: SegFrameObjects,
+    graf_frame: int,
+    graf_confs: List[float],
+    bad_frame_reasons: Dict[int, str],
+    fem_sph: FemSphere,
+    config: Config,
+    nifti_labels: np.ndarray = None,
+) -> Tuple[np.ndarray, bool, float]:
+    """
+    Draw a single hip ultrasound frame
+
+    :param hip: The Hip Data
+    :param seg_frame_objs: The Segmentation Frame Objects
+    :param graf_frame: The Graf Frame
+    :param graf_confs: The Graf Confidences per frame, if any
+    :param bad_frame_reasons: The reasons to display for bad frames
+    :param fem_sph: The Femoral Sphere, if it should be displayed
+    :param config: The Config
+    :param nifti_labels: The NIFTI label slice to draw the segmentations
+                         into, if exporting them
+
+    :return: The Drawn Image, whether it is the graf frame and the time
+             taken, which is only measured in dev mode
+    """
+    start = time.perf_counter() if config.dev else None
+
+    final_hip, final_seg_frame_objs, final_image = resize_data_for_display(
+        hip, seg_frame_objs
+    )
+
+    overlay = Overlay((final_image.shape[0], final_image.shape[1], 3), config)
+
+    overlay = draw_seg(final_seg_frame_objs, overlay, config)
+
+    overlay = draw_landmarks(final_hip, overlay)
+
+    overlay = draw_alpha(final_hip, overlay, config)
+    overlay = draw_coverage(final_hip, overlay, config)
+    overlay = draw_curvature(final_hip, overlay, config)
+
+    if fem_sph:
+        overlay = draw_fem_head(
+            final_hip,
+            fem_sph,
+            overlay,
+            config.hip.z_gap,
+        )
+
+    graf_conf = None
+    if graf_confs is not None:
+        graf_conf = graf_confs[hip.frame_no]
+
+    overlay, is_graf = draw_other(
+        final_hip,
+        final_seg_frame_objs,
+        graf_frame,
+        overlay,
+        final_image.shape[:2],
+        config,
+        graf_conf,
+    )
+
+    if hip.frame_no in bad_frame_reasons:
+        overlay.draw_text(
+            bad_frame_reasons[hip.frame_no],
+            final_image.shape[1] // 2,
+            final_image.shape[0] - 100,
+            header="h2",
+        )
+
+    img = overlay.apply_to_image(final_image)
+
+    if nifti_labels is not None:
+        _draw_nifti_labels(seg_frame_objs, nifti_labels)
+
+    timing = time.perf_counter() - start if config.dev else None
+
+    return img, is_graf, timing
+
+
+def _draw_nifti_labels(seg_frame_objs: SegFrameObjects, labels: np.ndarray):
+    """
+    Draw the segmentation labels of a frame into a NIFTI label slice.
+
+    Gives the same labels as `Overlay.get_nifti_frame` followed by
+    `convert_images_to_nifti_labels`, without the colour matching.
+
+    :param seg_frame_objs: The Segmentation Frame Objects
+    :param labels: The (height, width) label slice to draw into
+    """
+    height, width = labels.shape
+    label_img = Image.new("L", (width, height), 0)
+    draw = ImageDraw.Draw(label_img)
+
+    for seg_obj in seg_frame_objs:
+        if not seg_obj.empty:
+            draw.polygon(seg_obj.points, fill=seg_obj.cls.value + 1)
+
+    labels[:] = np.asarray(label_img)
+
+
+def _labels_to_nifti(labels: np.ndarray) -> NIFTI:
+    """
+    Convert a (frames, height, width) label volume to a NIFTI,
+    in the same orientation as `convert_images_to_nifti_labels`.
+
+    :param labels: The label volume
+
+    :return: The NIFTI
+    """
+    # frames last, then rotate 90 degrees and flip vertically to get to RAI
+    labels = np.flipud(np.rot90(np.moveaxis(labels, 0, -1)))
+    affine = np.diag([-1, -1, 1, 1])
+
+    return NIFTI(nib.Nifti1Image(labels, affine=affine), type=NIFTI_Types.NIBABEL)
+
+
 def draw_hips_us(
     hip_datas: HipDatasUS,
     results: List[SegFrameObjects],
@@ -80,88 +209,71 @@ def draw_hips_us(
 
     :return: The Drawn Images
     """
+    # Per-frame timings are only kept in dev mode
     draw_timings = []
+    draw_start = time.perf_counter()
     image_arrays = []
-    nifti_frames = []
     nifti = None
 
-    for i, (hip, seg_frame_objs) in enumerate(zip(hip_datas, results)):
-        start = time.time()
-
-        final_hip, final_seg_frame_objs, final_image = resize_data_for_display(
-            hip, seg_frame_objs
-        )
-
-        overlay = Overlay((final_image.shape[0], final_image.shape[1], 3), config)
-
-        overlay = draw_seg(final_seg_frame_objs, overlay, config)
-
-        overlay = draw_landmarks(final_hip, overlay)
-
-        overlay = draw_alpha(final_hip, overlay, config)
-        overlay = draw_coverage(final_hip, overlay, config)
-        overlay = draw_curvature(final_hip, overlay, config)
-
-        if fem_sph and config.hip.display_fem_guess:
-            overlay = draw_fem_head(
-                final_hip,
+    # Each frame draws its segmentation labels straight into its
+    # own slice of the NIFTI volume.
+    nifti_labels = None
+    nifti_slices = [None] * len(results)
+    if config.seg_export:
+        n_frames = min(len(hip_datas), len(results))
+        height, width = results[0].img.shape[:2]
+        nifti_labels = np.zeros((n_frames, height, width), dtype=np.uint16)
+        nifti_slices = list(nifti_labels)
+
+    # These are the same for every frame, so look them up once
+    graf_confs = getattr(hip_datas, "graf_confs", None)
+
+    bad_frame_reasons = {}
+    if config.hip.display_bad_frame_reasons:
+        bad_frame_reasons = getattr(hip_datas, "bad_frame_reasons", {})
+
+    if not config.hip.display_fem_guess:
+        fem_sph = None
+
+    # Frames are drawn independently, and most of the work is in OpenCV,
+    # NumPy and PIL calls that release the GIL, so draw them on a thread
+    # pool. map() keeps the frames in order.
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        frames = executor.map(
+            lambda hip, seg_frame_objs, nifti_slice: _draw_hip_us(
+                hip,
+                seg_frame_objs,
+                hip_datas.graf_frame,
+                graf_confs,
+                bad_frame_reasons,
                 fem_sph,
-                overlay,
-                config.hip.z_gap,
-            )
-
-        graf_conf = None
-        if hasattr(hip_datas, "graf_confs"):
-            graf_conf = hip_datas.graf_confs[hip.frame_no]
-
-        overlay, is_graf = draw_other(
-            final_hip,
-            final_seg_frame_objs,
-            hip_datas.graf_frame,
-            overlay,
-            final_image.shape[:2],
-            config,
-            graf_conf,
+                config,
+                nifti_slice,
+            ),
+            hip_datas,
+            results,
+            nifti_slices,
         )
 
-        if config.hip.display_bad_frame_reasons and hasattr(
-            hip_datas, "bad_frame_reasons"
-        ):
-            if hip.frame_no in hip_datas.bad_frame_reasons:
-                overlay.draw_text(
-                    hip_datas.bad_frame_reasons[hip.frame_no],
-                    final_image.shape[1] // 2,
-                    final_image.shape[0] - 100,
-                    header="h2",
-                )
-
-        img = overlay.apply_to_image(final_image)
-
-        if config.seg_export:
-            original_image = seg_frame_objs.img
-            test = overlay.get_nifti_frame(
-                seg_frame_objs,
-                # NOTE(sharpz7) I do not know why this needs to be reversed
-                (original_image.shape[1], original_image.shape[0]),
-            )
-            nifti_frames.append(test)
+        for img, is_graf, timing in frames:
+            # if its the graf frame, append 5 copies
+            repeats = len(results) // 6 if is_graf else 1
+            for _ in range(repeats):
+                image_arrays.append(img)
 
-        # if its the graf frame, append 5 copies
-        repeats = len(results) // 6 if is_graf else 1
-        for _ in range(repeats):
-            image_arrays.append(img)
+            if config.dev:
+                draw_timings.append(timing)
 
-        draw_timings.append(time.time() - start)
+    if not config.dev:
+        draw_timings = [time.perf_counter() - draw_start]
 
     start = time.time()
     if config.seg_export:
-        frames = nifti_frames
-
         if "Swapped Post and Ant" in hip_datas.recorded_error.errors:
-            frames = nifti_frames[::-1]
+            nifti_labels = nifti_labels[::-1]
 
         # convert to nifti
-        nifti = convert_images_to_nifti_labels(frames)
+        nifti = _labels_to_nifti(nifti_labels)
     else:
         nifti = None
 
@@ -257,31 +369,131 @@ def draw_other(
     return overlay, is_graf
 
 
-def draw_table(shape: tuple, hip_datas: HipDatasUS) -> np.ndarray:
+@lru_cache(maxsize=128)
+def _wrap_error_text(
+    text: str,
+    max_text_width: int,
+    font: int,
+    font_scale: float,
+    font_thickness: int,
+) -> Tuple[Tuple[str, ...], int]:
     """
-    Draw the table of the metrics onto an image
+    Wrap the error text to fit the table width.
 
-    :param shape: The Shape of the Image
-    :param hip_datas: The Hip Datas
+    Cached, as the same errors are drawn for every file in a batch.
 
-    :return: The Image with the Table and any errors
+    :param text: The error text
+    :param max_text_width: The maximum width of a line in pixels
+    :param font: The OpenCV font
+    :param font_scale: The font scale
+    :param font_thickness: The font thickness
+
+    :return: The wrapped lines and the line height
     """
-    start = time.time()
+    # Estimate the width of each character based on the font
+    (text_width, text_height), _ = cv2.getTextSize(
+        text, font, font_scale, font_thickness
+    )
+    char_width = text_width // len(text) if text else 1  # Estimate width of one char
 
-    # Create empty image with the specified shape
-    empty_img = np.zeros((shape[1], shape[0], 3), dtype=np.uint8)
+    # Wrap the text based on character width and max text width
+    wrap_width = max_text_width // char_width
+    wrapped_text = textwrap.fill(text, width=wrap_width)
 
-    # Find new shape by running 1024 algo
-    shape = ImageOps.contain(Image.fromarray(empty_img), (TARGET_SIZE)).size[:2]
+    # Spacing between lines
+    return tuple(wrapped_text.split("\n")), text_height + 10
 
-    headers = [""] + hip_datas.metrics[0].names()
-    values = []
 
-    for metrics in reversed(hip_datas.metrics):
-        values.append(metrics.dump())
+# Colours used by the OpenCV table, matching the plotly defaults
+_TABLE_HEADER_FILL = (200, 212, 227)
+_TABLE_FIRST_COLUMN_FILL = (175, 238, 238)  # paleturquoise
+_TABLE_CELL_FILL = (255, 255, 255)
+_TABLE_LINE_COLOR = (255, 255, 255)
+_TABLE_TEXT_COLOR = (42, 63, 95)
+
+
+def _draw_table_cv2(
+    shape: Tuple[int, int], headers: List[str], rows: List[list]
+) -> np.ndarray:
+    """
+    Draw a table directly with OpenCV.
+
+    Much faster than rendering a plotly table to a PNG, which needs
+    a Kaleido subprocess.
+
+    :param shape: The (height, width) of the image
+    :param headers: The column headers
+    :param rows: The rows of cell values
+
+    :return: The Image with the Table
+    """
+    MARGIN = 30
+    ROW_HEIGHT = 50
+    font = cv2.FONT_HERSHEY_SIMPLEX
+    font_scale = 0.6
+    font_thickness = 1
+
+    data_image = np.full((shape[0], shape[1], 3), 255, dtype=np.uint8)
+    col_width = (shape[1] - 2 * MARGIN) / len(headers)
+
+    for row_no, row in enumerate([headers, *rows]):
+        y1 = MARGIN + row_no * ROW_HEIGHT
+        y2 = y1 + ROW_HEIGHT
+
+        for col_no, value in enumerate(row):
+            x1 = round(MARGIN + col_no * col_width)
+            x2 = round(MARGIN + (col_no + 1) * col_width)
+
+            if row_no == 0:
+                fill = _TABLE_HEADER_FILL
+            elif col_no == 0:
+                fill = _TABLE_FIRST_COLUMN_FILL
+            else:
+                fill = _TABLE_CELL_FILL
+
+            cv2.rectangle(data_image, (x1, y1), (x2, y2), fill, cv2.FILLED)
+            cv2.rectangle(data_image, (x1, y1), (x2, y2), _TABLE_LINE_COLOR, 1)
+
+            text = str(value)
+            (text_width, text_height), _ = cv2.getTextSize(
+                text, font, font_scale, font_thickness
+            )
+
+            # Shrink any text that does not fit in its cell
+            scale = font_scale
+            if text_width > x2 - x1 - 10:
+                scale *= (x2 - x1 - 10) / text_width
+                text_width = int(text_width * scale / font_scale)
+                text_height = int(text_height * scale / font_scale)
+
+            cv2.putText(
+                data_image,
+                text,
+                ((x1 + x2 - text_width) // 2, (y1 + y2 + text_height) // 2),
+                font,
+                scale,
+                _TABLE_TEXT_COLOR,
+                font_thickness,
+                cv2.LINE_AA,
+            )
+
+    return data_image
+
+
+def _draw_table_plotly(
+    shape: Tuple[int, int], headers: List[str], rows: List[list]
+) -> np.ndarray:
+    """
+    Draw a table by rendering a plotly figure.
+
+    :param shape: The (height, width) of the image
+    :param headers: The column headers
+    :param rows: The rows of cell values
 
-    # Rotate and transpose the values list
-    values = list(zip(*values[::-1]))
+    :return: The Image with the Table
+    """
+    # plotly takes the cell values column by column
+    values = list(zip(*rows))
 
     # Create a Plotly figure for the table
     fig = go.Figure(
@@ -310,7 +522,34 @@ def draw_table(shape: tuple, hip_datas: HipDatasUS) -> np.ndarray:
     img_bytes = fig.to_image(format="png", width=shape[1], height=shape[0])
 
     # Convert image bytes to numpy array
-    data_image = np.array(Image.open(io.BytesIO(img_bytes)).convert("RGB"))
+    return np.array(Image.open(io.BytesIO(img_bytes)).convert("RGB"))
+
+
+def draw_table(
+    shape: tuple, hip_datas: HipDatasUS, config: Config = None
+) -> np.ndarray:
+    """
+    Draw the table of the metrics onto an image
+
+    :param shape: The Shape of the Image
+    :param hip_datas: The Hip Datas
+    :param config: The Config, used to pick the table backend.
+                   Defaults to drawing with OpenCV.
+
+    :return: The Image with the Table and any errors
+    """
+    start = time.time()
+
+    # Find new shape by running 1024 algo
+    shape = contain_size(shape[0], shape[1], TARGET_SIZE)
+
+    headers = [""] + hip_datas.metrics[0].names()
+    rows = [metrics.dump() for metrics in hip_datas.metrics]
+
+    if config is not None and config.visuals.table_backend == "plotly":
+        data_image = _draw_table_plotly(shape, headers, rows)
+    else:
+        data_image = _draw_table_cv2(shape, headers, rows)
 
     # Text Wrapping Logic
     recorded_error_text = str(hip_datas.recorded_error)
@@ -321,24 +560,12 @@ def draw_table(shape: tuple, hip_datas: HipDatasUS) -> np.ndarray:
     font = cv2.FONT_HERSHEY_SIMPLEX
     font_thickness = 2
 
-    # Estimate the width of each character based on the font
-    (text_width, text_height), _ = cv2.getTextSize(
-        recorded_error_text, font, font_scale, font_thickness
+    lines, line_height = _wrap_error_text(
+        recorded_error_text, max_text_width, font, font_scale, font_thickness
     )
-    char_width = (
-        text_width // len(recorded_error_text) if recorded_error_text else 1
-    )  # Estimate width of one char
-
-    # Wrap the text based on character width and max text width
-    wrap_width = max_text_width // char_width
-    wrapped_text = textwrap.fill(recorded_error_text, width=wrap_width)
-
-    # Split the wrapped text into lines
-    lines = wrapped_text.split("\n")
 
     # Draw each line of wrapped text
     y = data_image.shape[0] - 300  # Starting y position
-    line_height = text_height + 10  # Spacing between lines
     for line in lines:
         # Put each line of text on the image
         cv2.putText(
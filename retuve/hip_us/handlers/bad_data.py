@@ -16,7 +16,9 @@
 Handles bad Hip Data Objects by removing outliers and empty frames.
 """
 
-from typing import List
+import math
+from itertools import chain, repeat
+from typing import List, Union
 
 import numpy as np
 
@@ -36,30 +38,33 @@ def remove_outliers(hip_datas: HipDatasUS, config: Config) -> List[bool]:
 
     :return: List of booleans indicating which frames to keep.
     """
-    pred_made = [(True if hip.marked() else False) for hip in hip_datas]
+    pred_made = hip_datas.marked_mask()
 
-    # Use this as a sliding window to find the position where
-    # the most Trues fit in the window
-    # Get total number of True values
-    total_true = sum(pred_made)
+    # Use a sliding window the size of the total number of Trues,
+    # to find the position where the most Trues fit in the window
+    total_true = int(np.count_nonzero(pred_made))
 
-    # Sliding window to find the position where the most Trues fit in the window
-    max_true = 0
-    max_true_index = 0
+    if total_true == 0:
+        return [False] * len(pred_made)
 
-    for i in range(len(pred_made) - total_true + 1):
-        current_window_true = sum(pred_made[i : i + total_true])
-        if current_window_true > max_true:
-            max_true = current_window_true
-            max_true_index = i
+    # If the Trues are already one contiguous run (including all True),
+    # that run is the only window holding all of them, so keep it as is.
+    true_indices = np.flatnonzero(pred_made)
+    if true_indices[-1] - true_indices[0] + 1 == total_true:
+        return pred_made.tolist()
 
-    # Create a list of Trues and Falses
-    keep = [False] * len(pred_made)
-    for i in range(max_true_index, max_true_index + total_true):
-        if pred_made[i]:
-            keep[i] = True
+    # Every window sum at once, from differences of the cumulative sum.
+    # argmax picks the first best window, as the original loop did.
+    cumsum = np.concatenate(([0], np.cumsum(pred_made)))
+    window_trues = cumsum[total_true:] - cumsum[:-total_true]
+    max_true_index = int(np.argmax(window_trues))
 
-    return keep
+    # Keep only the Trues inside the best window
+    keep = np.zeros(len(pred_made), dtype=bool)
+    window = slice(max_true_index, max_true_index + total_true)
+    keep[window] = pred_made[window]
+
+    return keep.tolist()
 
 
 def left_apex_line_flat(hip: HipDataUS) -> bool:
@@ -73,17 +78,25 @@ def left_apex_line_flat(hip: HipDataUS) -> bool:
     if hip.landmarks.left is None or hip.landmarks.apex is None:
         return True
 
-    C, A, B = (
-        np.array(hip.landmarks.left),
-        np.array(hip.landmarks.apex),
-        np.array((hip.landmarks.apex[0], hip.landmarks.left[1])),
-    )
+    (cx, cy), (ax, ay) = hip.landmarks.left, hip.landmarks.apex
+
+    # Angle at the left point, between the left-apex line and the
+    # horizontal, from the law of cosines on the right angled triangle
+    # left, apex and (apex x, left y). Plain floats, as NumPy's call
+    # overhead dwarfs the arithmetic on 2D points.
+    a = math.hypot(cx - ax, 0)
+    b = math.hypot(cx - ax, cy - ay)
+    d = math.hypot(0, ay - cy)
+
+    if a * b == 0:
+        # NumPy gave a nan angle here, which is not flat
+        return False
 
-    a = np.linalg.norm(C - B)
-    b = np.linalg.norm(C - A)
+    cos_angle = (a**2 + b**2 - d**2) / (2 * a * b)
+    if not -1 <= cos_angle <= 1:
+        return False
 
-    angle = np.arccos((a**2 + b**2 - np.linalg.norm(A - B) ** 2) / (2 * a * b))
-    angle = np.degrees(angle)
+    angle = math.degrees(math.acos(cos_angle))
 
     return abs(angle) < 10
 
@@ -99,10 +112,39 @@ def apex_right_points_too_close(hip: HipDataUS) -> bool:
     if hip.landmarks.right is None or hip.landmarks.apex is None:
         return True
 
-    return (
-        np.linalg.norm(np.array(hip.landmarks.right) - np.array(hip.landmarks.apex))
-        < 30
-    )
+    (rx, ry), (ax, ay) = hip.landmarks.right, hip.landmarks.apex
+
+    # compare squared distances, to avoid the square root
+    return (rx - ax) ** 2 + (ry - ay) ** 2 < 30**2
+
+
+def _bad_frame_reason(hip: HipDataUS) -> Union[str, None]:
+    """
+    Get the reason a frame is bad, checked in order of cost.
+
+    :param hip: HipDataUS object.
+
+    :return: The reason the frame is bad, or None if it is good.
+    """
+    if not hip.marked():
+        return "No Metrics"
+
+    if hip.landmarks is None:
+        return "No Landmarks"
+
+    if bad_alpha(hip):
+        return "Alpha Angle Non-Sensical"
+
+    if not left_apex_line_flat(hip):
+        return "Ilium Line not Flat"
+
+    if bad_coverage(hip):
+        return "Coverage Value Non-Sensical"
+
+    if apex_right_points_too_close(hip):
+        return "Apex and Right Too Close"
+
+    return None
 
 
 def handle_bad_frames(hip_datas: HipDatasUS, config: Config) -> HipDatasUS:
@@ -114,59 +156,35 @@ def handle_bad_frames(hip_datas: HipDatasUS, config: Config) -> HipDatasUS:
 
     :return: HipDatasUS object.
     """
+    is_sweep = config.batch.hip_mode == HipMode.US2DSW
 
-    if config.batch.hip_mode == HipMode.US2DSW:
-        keep = [(True if hip.marked() else False) for hip in hip_datas]
+    if is_sweep:
+        keep = hip_datas.marked_mask()
     else:
         keep = remove_outliers(hip_datas, config)
 
     bad_frame_reasons = {}
+    new_hips = []
 
-    for i, (hip, rejection_reasons) in enumerate(
-        zip(hip_datas, hip_datas.all_seg_rejection_reasons)
+    # pad the rejection reasons, so a shorter list never drops frames
+    all_rejection_reasons = chain(hip_datas.all_seg_rejection_reasons, repeat([]))
+
+    for i, (hip, kept, rejection_reasons) in enumerate(
+        zip(hip_datas, keep, all_rejection_reasons)
     ):
+        if kept:
+            reason = _bad_frame_reason(hip)
+            if reason is None:
+                new_hips.append(hip)
+                continue
+            bad_frame_reasons[i] = reason
+
+        elif is_sweep:
+            bad_frame_reasons[i] = " ".join(rejection_reasons) or "Not Enough Data"
 
-        empty_hip = HipDataUS(
-            frame_no=hip.frame_no,
-        )
-
-        if not keep[i]:
-            hip_datas[i] = empty_hip
-            if config.batch.hip_mode == HipMode.US2DSW:
-                bad_frame_reasons[i] = " ".join(rejection_reasons)
-                if not rejection_reasons:
-                    bad_frame_reasons[i] = "Not Enough Data"
-            continue
-
-        if (not hip.metrics) or all(metric.value == 0 for metric in hip.metrics):
-            hip_datas[i] = empty_hip
-            bad_frame_reasons[i] = "No Metrics"
-            continue
-
-        if hip.landmarks is None:
-            hip_datas[i] = empty_hip
-            bad_frame_reasons[i] = "No Landmarks"
-            continue
-
-        if bad_alpha(hip):
-            hip_datas[i] = empty_hip
-            bad_frame_reasons[i] = "Alpha Angle Non-Sensical"
-            continue
-
-        if not left_apex_line_flat(hip):
-            hip_datas[i] = empty_hip
-            bad_frame_reasons[i] = "Ilium Line not Flat"
-            continue
-
-        if bad_coverage(hip):
-            hip_datas[i] = empty_hip
-            bad_frame_reasons[i] = "Coverage Value Non-Sensical"
-            continue
-
-        if apex_right_points_too_close(hip):
-            hip_datas[i] = empty_hip
-            bad_frame_reasons[i] = "Apex and Right Too Close"
-            continue
+        new_hips.append(HipDataUS(frame_no=hip.frame_no))
 
+    # Rebuild the list once, rather than replacing bad frames one by one
+    hip_datas.hip_datas = new_hips
     hip_datas.bad_frame_reasons = bad_frame_reasons
     return hip_datas
@@ -40,34 +40,45 @@ def remove_bad_objs(
 
     rejection_reasons = []
 
+    height, width = img.shape[0], img.shape[1]
+    # Femoral Heads should be at least 2.5%
+    expected_min_fem_size = height * width * 0.025
+
     fem_head_ilium_wrong_way_round = False
-    if len(hip_objs[HipLabelsUS.IlliumAndAcetabulum]) > 1:
-        hip_objs[HipLabelsUS.IlliumAndAcetabulum] = [
-            sorted(
-                hip_objs[HipLabelsUS.IlliumAndAcetabulum],
-                key=lambda seg_obj: seg_obj.box[0],
-            )[0]
-        ]
-
-    # replace each value with the largest object
+
+    # areas of the chosen objects, so they are only summed over once
+    areas = {}
+
+    # replace each value with the left-most Illium and Acetabulum,
+    # or the largest object for everything else
     for k, v in hip_objs.items():
-        if len(v) != 0:
-            hip_objs[k] = max(v, key=lambda seg_obj: seg_obj.area())
-        else:
+        if len(v) == 0:
             hip_objs[k] = SegObject(empty=True)
+        elif k == HipLabelsUS.IlliumAndAcetabulum:
+            hip_objs[k] = min(v, key=lambda seg_obj: seg_obj.box[0])
+        elif len(v) == 1:
+            hip_objs[k] = v[0]
+        else:
+            obj_areas = [seg_obj.area() for seg_obj in v]
+            largest = max(range(len(v)), key=obj_areas.__getitem__)
+            hip_objs[k] = v[largest]
+            areas[k] = obj_areas[largest]
 
     fem_head = hip_objs.get(HipLabelsUS.FemoralHead, None)
 
     illium = hip_objs.get(HipLabelsUS.IlliumAndAcetabulum, None)
-    if illium and illium.box is not None and illium.box[0] > img.shape[1] / 2:
+    if illium and illium.box is not None and illium.box[0] > width / 2:
         # check if the femoral head box is left of the illium box
         if fem_head and fem_head.box is not None and illium.box[0] > fem_head.box[0]:
             fem_head_ilium_wrong_way_round = True
 
-    # Femoral Heads should be at least 2.5%
-    expected_min_fem_size = img.shape[0] * img.shape[1] * 0.025
-    if fem_head and fem_head.area() < expected_min_fem_size:
-        hip_objs[HipLabelsUS.FemoralHead] = SegObject(empty=True)
-        rejection_reasons.append("Femoral Head too small")
+    if fem_head:
+        fem_head_area = areas.get(HipLabelsUS.FemoralHead)
+        if fem_head_area is None:
+            fem_head_area = fem_head.area()
+
+        if fem_head_area < expected_min_fem_size:
+            hip_objs[HipLabelsUS.FemoralHead] = SegObject(empty=True)
+            rejection_reasons.append("Femoral Head too small")
 
     return hip_objs, fem_head_ilium_wrong_way_round, rejection_reasons
@@ -21,6 +21,8 @@ Retuve is set up to have the Anterior side first and the Posterior side second.
 
 from typing import List, Tuple
 
+import numpy as np
+
 from retuve.classes.seg import SegFrameObjects
 from retuve.hip_us.classes.enums import HipLabelsUS, Side
 from retuve.hip_us.classes.general import HipDatasUS, HipDataUS
@@ -53,14 +55,14 @@ def get_side_metainfo(
 
     illium = illium[0]
 
-    illium_midline = illium.midline
+    # midline points are (y, x), so compare against the x column
+    illium_midline = np.asarray(illium.midline)
+    closest_index = np.argmin(np.abs(illium_midline[:, 1] - mid[0]))
 
     # reverse x and y in midline
-    illium_midline = [(y, x) for x, y in illium_midline]
-
-    closest_illium = min(
-        illium_midline,
-        key=lambda point: abs(point[0] - mid[0]),
+    closest_illium = (
+        illium_midline[closest_index, 1],
+        illium_midline[closest_index, 0],
     )
 
     return closest_illium, mid
@@ -80,11 +82,13 @@ def reverse_3dus_orientaition(
     :param allow_flipping: Boolean indicating if flipping is allowed.
 
     :return: Tuple of HipDatasUS object and List of SegFrameObjects.
+             If the sides are swapped, both lists are reversed in place.
     """
 
-    # split the hip datas into two sides, based on graf frame
-    front_side = []
-    back_side = []
+    # collect the deltas for every frame, and split them into two sides
+    # based on the graf frame afterwards
+    deltas = []
+    is_front = []
 
     for hip_data, seg_frame_objs in zip(hip_datas, results):
         if hip_data.landmarks is None or hip_data.landmarks.apex is None:
@@ -96,35 +100,33 @@ def reverse_3dus_orientaition(
             continue
 
         # Find the y distance between the midline points
-        delta = mid[1] - closest_illium[1]
+        deltas.append(mid[1] - closest_illium[1])
+        is_front.append(hip_data.frame_no < hip_datas.graf_frame)
 
-        if hip_data.frame_no < hip_datas.graf_frame:
-            front_side.append(delta)
-        else:
-            back_side.append(delta)
+    deltas = np.array(deltas, dtype=float)
+    is_front = np.array(is_front, dtype=bool)
+    front_side = deltas[is_front]
+    back_side = deltas[~is_front]
 
     for side in [("Front", front_side), ("Back", back_side)]:  # noqa
-        if len(side[1]) == 0:
+        if side[1].size == 0:
             hip_datas.recorded_error.append(f"No {side[0]} Side.")
             hip_datas.recorded_error.critical = True
 
-    if len(front_side) == 0:
-        front_side = [0]
-    if len(back_side) == 0:
-        back_side = [0]
-
-    if front_side == [0] and back_side == [0]:
+    # a side is treated as [0] when it is empty or only has a single 0 delta
+    if all(side.size <= 1 and not side.any() for side in (front_side, back_side)):
         hip_datas.recorded_error.append("No Side Detected.")
         return hip_datas, results
 
-    back_side_delta = sum(back_side) / len(back_side)
-    front_side_delta = sum(front_side) / len(front_side)
+    back_side_delta = back_side.mean() if back_side.size else 0
+    front_side_delta = front_side.mean() if front_side.size else 0
 
     flip_frames = False
     if (back_side_delta > front_side_delta) and allow_flipping:
         hip_datas.recorded_error.append("Swapped Post and Ant")
-        hip_datas.hip_datas = hip_datas.hip_datas[::-1]
-        results = results[::-1]
+        # reverse in place, rather than copying both lists
+        hip_datas.hip_datas.reverse()
+        results.reverse()
         hip_datas.graf_frame = len(hip_datas) - hip_datas.graf_frame
         flip_frames = True
 
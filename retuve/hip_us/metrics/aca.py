@@ -19,7 +19,6 @@ Meant to be a more accurate version of alpha angle for 3D Ultrasounds.
 
 """
 
-import copy
 from enum import Enum
 from typing import Dict, List, Tuple
 
@@ -57,6 +56,10 @@ ACA_COLORS = {
 }
 
 
+# The order of the thirds along the z axis
+_THIRDS = (Side.POST, Side.GRAF, Side.ANT)
+
+
 class Triangle:
     """
     Class to store the data of a triangle for the ACA calculation.
@@ -74,12 +77,13 @@ class Triangle:
         third: Side,
         normal: NDArray[np.float64],
         centroid: NDArray[np.float64],
+        color: str = None,
     ):
         self.apex_side = apex_side
         self.third = third
         self.normal = normal
         self.centroid = centroid
-        self.color = ACA_COLORS[(apex_side, third)]
+        self.color = color or ACA_COLORS[(apex_side, third)]
 
 
 @warning_decorator(alpha=True)
@@ -114,79 +118,71 @@ def get_aca(
     normals = np.asarray(illium_mesh.vertex_normals)
     vertices = np.asarray(illium_mesh.vertices)
 
-    # Compute triangle normals
-    triangle_normals = []
-    triangle_centroids = []
-    for tri in illium_mesh.triangles:
-        v0, v1, v2 = vertices[tri]
-        edge1 = v1 - v0
-        edge2 = v2 - v0
-        normal = np.cross(edge1, edge2)
-        centroid = (v0 + v1 + v2) / 3
-        triangle_normals.append(normal)
-        triangle_centroids.append(centroid)
-
-    triangle_normals = np.array(triangle_normals)
-    triangle_centroids = np.array(triangle_centroids)
+    # Compute all the triangle normals and centroids at once,
+    # from the (no. of triangles, 3, 3) array of their vertices
+    v0, v1, v2 = vertices[np.asarray(illium_mesh.triangles)].transpose(1, 0, 2)
+    triangle_normals = np.cross(v1 - v0, v2 - v0)
+    triangle_centroids = (v0 + v1 + v2) / 3
 
     # convert normals to unit vectors
     triangle_normals /= np.linalg.norm(triangle_normals, axis=1)[:, None]
 
-    triangle_data = []
-
-    max_z = np.max(triangle_centroids[:, 2])
-    min_z = np.min(triangle_centroids[:, 2])
+    centroids_z = triangle_centroids[:, 2]
+    max_z = np.max(centroids_z)
+    min_z = np.min(centroids_z)
 
-    for normal, centroid in zip(triangle_normals, triangle_centroids):
-        if config.hip.aca_split == ACASplit.THIRDS:
-            third_z = (max_z - min_z) / 3
+    # Split the triangles into thirds, as indexes into _THIRDS
+    if config.hip.aca_split == ACASplit.THIRDS:
+        third_z = (max_z - min_z) / 3
+        from_min_z = centroids_z - min_z
 
-            # find which third the centroid is in
-            if centroid[2] - min_z < third_z:
-                third = Side.POST
-            elif centroid[2] - min_z < third_z * 2:
-                third = Side.GRAF
-            else:
-                third = Side.ANT
-
-        elif config.hip.aca_split == ACASplit.GRAFS:
-            grafs_z = graf_hip.frame_no * z_gap
-
-            grafs_z = grafs_z
+        third_codes = np.where(
+            from_min_z < third_z, 0, np.where(from_min_z < third_z * 2, 1, 2)
+        )
 
-            margin = (max_z - min_z) * 0.15
+    elif config.hip.aca_split == ACASplit.GRAFS:
+        grafs_z = graf_hip.frame_no * z_gap
+        margin = (max_z - min_z) * 0.15
+        min_graf_z = grafs_z - margin
 
-            min_graf_z = grafs_z - margin
+        # if it is within 15% of the grafs_z, it is in the graf third
+        third_codes = np.where(
+            np.abs(centroids_z - grafs_z) < margin,
+            1,
+            np.where(centroids_z < min_graf_z, 0, 2),
+        )
 
-            # if it is within 10% of the grafs_z, third = 2
-            if abs(centroid[2] - grafs_z) < margin:
-                third = Side.GRAF
-            elif centroid[2] < min_graf_z:
-                third = Side.POST
-            else:
-                third = Side.ANT
+    else:
+        raise ValueError("Invalid ACA Split Config Option")
 
-        else:
-            raise ValueError("Invalid ACA Split Config Option")
+    # get the apex point with the closest z value to each triangle,
+    # one apex point at a time to avoid a (triangles, apex points) array
+    apex_points = np.asarray(apex_points, dtype=np.float64)
+    closest_apex_x = np.full(len(centroids_z), np.nan)
+    closest_apex_dist = np.full(len(centroids_z), np.inf)
 
-        apex_points = copy.deepcopy(np.array(apex_points))
+    for apex_x, _, apex_z in apex_points:
+        dist = np.abs(apex_z - centroids_z)
+        # strictly closer, so ties keep the first apex point like argmin
+        closer = dist < closest_apex_dist
+        closest_apex_dist[closer] = dist[closer]
+        closest_apex_x[closer] = apex_x
 
-        # get the apex point with the closest z value
-        apex_point = apex_points[np.argmin(np.abs(apex_points[:, 2] - centroid[2]))]
+    is_left = triangle_centroids[:, 0] < closest_apex_x
 
-        if centroid[0] < apex_point[0]:
-            apex_side = SideZ.LEFT
-        else:
-            apex_side = SideZ.RIGHT
+    # The (apex side, third, color) of each combination, indexed by
+    # is_left and the third code, so colors are not looked up per triangle
+    groups = [
+        [(apex_side, third, ACA_COLORS[(apex_side, third)]) for third in _THIRDS]
+        for apex_side in (SideZ.RIGHT, SideZ.LEFT)
+    ]
 
-        triangle_data.append(
-            Triangle(
-                apex_side,
-                third,
-                normal,
-                centroid,
-            )
-        )
+    triangle_data = []
+    for left, third_code, normal, centroid in zip(
+        is_left.tolist(), third_codes.tolist(), triangle_normals, triangle_centroids
+    ):
+        apex_side, third, color = groups[left][third_code]
+        triangle_data.append(Triangle(apex_side, third, normal, centroid, color))
 
     final_vectors = {
         # (left, 1): vec
@@ -194,28 +190,21 @@ def get_aca(
 
     avg_normals_data = []
 
-    # for each color combination, find the average normal and add a cone for it
-    for apex_side in [SideZ.LEFT, SideZ.RIGHT]:
-        for third in Side.ALL():
-            normals = []
-            centroids = []
+    sides = Side.ALL()
 
-            for triangle in triangle_data:
-                if triangle.apex_side == apex_side and triangle.third == third:
-                    normals.append(triangle.normal)
-                    centroids.append(triangle.centroid)
+    # for each color combination, find the average normal and add a cone for it
+    for apex_side, side_mask in ((SideZ.LEFT, is_left), (SideZ.RIGHT, ~is_left)):
+        for third in sides:
+            mask = side_mask & (third_codes == _THIRDS.index(third))
 
             # This error is recorded in other places.
             # And will happen when the grafs plane is detected
             # At the edges of the measured region
-            if len(normals) == 0:
+            if not mask.any():
                 continue
 
-            normals = np.array(normals)
-            centroids = np.array(centroids)
-
-            avg_normal = np.mean(normals, axis=0)
-            avg_centroid = np.mean(centroids, axis=0)
+            avg_normal = np.mean(triangle_normals[mask], axis=0)
+            avg_centroid = np.mean(triangle_centroids[mask], axis=0)
 
             avg_normals_data.append(
                 (
@@ -230,7 +219,7 @@ def get_aca(
     aca_angles = {}
 
     # for each third, find the angle between the apex left and right
-    for side in Side.ALL():
+    for side in sides:
         try:
             apex_left = final_vectors[SideZ.LEFT, side]
             apex_right = final_vectors[SideZ.RIGHT, side]
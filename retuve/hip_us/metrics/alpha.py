@@ -17,6 +17,8 @@ Metric: Alpha Angle
 
 """
 
+import math
+
 import numpy as np
 
 from retuve.classes.draw import Overlay
@@ -45,7 +47,7 @@ def find_alpha_landmarks(
     if not (
         illium
         and any(m in config.hip.measurements for m in MetricUS.ALL())
-        and illium.mask is not None
+        and illium.mask_2d is not None
     ):
         return landmarks
 
@@ -70,14 +72,11 @@ def find_alpha_landmarks(
     m_orth = -1 / m
     # for each point along the line, find the distance between that point and the
 
-    points_on_line = np.array(
-        [[x, m * x + b] for x in range(int(left_most[1]), int(right_most[1]), 1)]
-    )
+    line_xs = np.arange(int(left_most[1]), int(right_most[1]))
+    points_on_line = np.column_stack((line_xs, m * line_xs + b))
 
-    # Convert white_points to a convenient shape for vector operations
-    midline_moved = np.array(illium.midline_moved)[
-        :, ::-1
-    ]  # Reverse each point only once
+    # Reverse each point through a view, as the midline is already an array
+    midline_moved = np.asarray(illium.midline_moved)[:, ::-1]
 
     # Create an array for b_orth values for each point in points_on_line
     b_orth_array = points_on_line[:, 1] - m_orth * points_on_line[:, 0]
@@ -88,19 +87,17 @@ def find_alpha_landmarks(
     # Check which white points are close to each orthogonal line
     close_points = np.isclose(y_values_orth_line, midline_moved[:, 1], atol=0.8)
 
-    # Calculate distances for all point pairs
-    distances = np.linalg.norm(points_on_line[:, np.newaxis, :] - midline_moved, axis=2)
-
-    # Mask distances with close_points to consider only relevant distances
-    masked_distances = np.where(close_points, distances, 0)
+    # Only calculate distances for the point pairs that are close,
+    # rather than for every pair and masking afterwards
+    line_indexes, apex_indexes = np.nonzero(close_points)
+    diff = points_on_line[line_indexes] - midline_moved[apex_indexes]
+    distances = np.sqrt(diff[:, 0] * diff[:, 0] + diff[:, 1] * diff[:, 1])
 
     # Find the maximum distance and the corresponding points
-    max_distance = np.max(masked_distances)
-    max_distance = np.max(masked_distances)
-    if max_distance > 0:
-        point_index, apex_point_index = np.unravel_index(
-            np.argmax(masked_distances), masked_distances.shape
-        )
+    best_index = np.argmax(distances) if distances.size else None
+    if best_index is not None and distances[best_index] > 0:
+        point_index = line_indexes[best_index]
+        apex_point_index = apex_indexes[best_index]
         best_point = tuple(points_on_line[point_index])
         # Check APEX_RIGHT_FACTOR is within bounds
         if apex_point_index + APEX_RIGHT_FACTOR < len(midline_moved):
@@ -111,10 +108,7 @@ def find_alpha_landmarks(
 
         best_apex_point = tuple(midline_moved[apex_point_index + factor])
 
-        left_most, right_most = find_midline_extremes(illium.midline_moved)
-        if right_most is None or left_most is None:
-            return landmarks
-
+        # the extremes found above are still valid, so reuse them
         left_most, right_most = tuple(reversed(left_most)), tuple(reversed(right_most))
         mid_x = (left_most[0] + right_most[0]) / 2
         if (
@@ -144,18 +138,20 @@ def find_alpha_angle(points: LandmarksUS) -> float:
     if not (points and points.left and points.apex and points.right):
         return 0
 
-    # find angle ABC of points
-    A, B, C = (
-        np.array(points.left),
-        np.array(points.apex),
-        np.array(points.right),
-    )
-    AB = np.linalg.norm(A - B)
-    BC = np.linalg.norm(B - C)
-    AC = np.linalg.norm(A - C)
-    angle = np.arccos((BC**2 + AB**2 - AC**2) / (2 * BC * AB))
-
-    angle = np.degrees(angle)
+    # find angle ABC of points, with plain floats as there are only 3 points
+    (Ax, Ay), (Bx, By), (Cx, Cy) = points.left, points.apex, points.right
+    AB = math.sqrt((Ax - Bx) ** 2 + (Ay - By) ** 2)
+    BC = math.sqrt((Bx - Cx) ** 2 + (By - Cy) ** 2)
+    AC = math.sqrt((Ax - Cx) ** 2 + (Ay - Cy) ** 2)
+
+    # degenerate triangles have no angle
+    if BC * AB == 0:
+        return math.nan
+    cos_angle = (BC**2 + AB**2 - AC**2) / (2 * BC * AB)
+    if not -1 <= cos_angle <= 1:
+        return math.nan
+
+    angle = math.degrees(math.acos(cos_angle))
     angle = round((180 - angle), 1)
 
     return round(angle, 2)
@@ -223,8 +219,5 @@ def bad_alpha(hip: HipDataUS) -> bool:
 
     :return: bool: True if the Alpha Angle is bad.
     """
-
-    if hip.get_metric(MetricUS.ALPHA) < 20 or hip.get_metric(MetricUS.ALPHA) > 100:
-        return True
-
-    return False
+    alpha = hip.get_metric(MetricUS.ALPHA)
+    return bool(alpha < 20 or alpha > 100)
@@ -47,10 +47,10 @@ def get_dev_metrics(
     fem_marked_hips = []
 
     for hip_data, seg_frame_objs in zip(hip_datas, results):
-        detected = [seg_obj.cls for seg_obj in seg_frame_objs]
-        detected_bool = any(detected)
+        # a set, as it is checked for several classes below
+        detected = {seg_obj.cls for seg_obj in seg_frame_objs}
 
-        if detected_bool:
+        if any(detected):
             dev_metrics.no_frames_segmented += 1
 
         if hip_data.marked():
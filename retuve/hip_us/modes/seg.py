@@ -48,14 +48,15 @@ def get_midlines(
     Get the midline of the illium mask. This is used to '
     find the landmarks for the alpha angle.
 
-    :param mask: The mask of the illium.
+    :param mask: The mask of the illium, either RGB or single channel.
     :param config: The configuration object.
     :param color: The color of the midline.
 
     :return: The midline of the illium.
     """
 
-    mask = cv2.cvtColor(mask, cv2.COLOR_RGB2GRAY)
+    if mask.ndim == 3:
+        mask = cv2.cvtColor(mask, cv2.COLOR_RGB2GRAY)
     # Takes bool as input and returns bool as output
     midline = skeletonize(mask > 0)
     midline = midline.astype(np.uint8) * color
@@ -197,7 +198,7 @@ def pre_process_segs_us(
                 continue
 
             seg_object.midline, seg_object.midline_moved = get_midlines(
-                seg_object.mask, config
+                seg_object.mask_2d, config
             )
 
         timings.append(time.time() - start)
@@ -17,6 +17,7 @@ High Level Functions for Multiframe Analysis
 """
 
 import json
+import math
 import os
 from typing import List
 
@@ -46,17 +47,17 @@ def _get_left_apex_angle(hip) -> bool:
     if hip.landmarks is None:
         return True
 
-    C, A, B = (
-        np.array(hip.landmarks.left),
-        np.array(hip.landmarks.apex),
-        np.array((hip.landmarks.apex[0], hip.landmarks.left[1])),
-    )
+    (cx, cy), (ax, ay) = hip.landmarks.left, hip.landmarks.apex
 
-    a = np.linalg.norm(C - B)
-    b = np.linalg.norm(C - A)
+    # Law of cosines on the triangle left, apex and (apex x, left y),
+    # with plain floats, as NumPy's call overhead dwarfs the arithmetic.
+    a = math.hypot(cx - ax, 0)
+    b = math.hypot(cx - ax, cy - ay)
+    d = math.hypot(0, ay - cy)
 
-    angle = np.arccos((a**2 + b**2 - np.linalg.norm(A - B) ** 2) / (2 * a * b))
-    angle = np.degrees(angle)
+    # Degenerate triangles give nan, as np.arccos did before
+    cos_angle = (a**2 + b**2 - d**2) / (2 * a * b) if a * b else math.nan
+    angle = math.degrees(math.acos(cos_angle)) if -1 <= cos_angle <= 1 else math.nan
 
     return int(angle)
 
@@ -98,10 +99,7 @@ def _get_femoral_head_roundness(seg_frame_objs) -> float:
     ]
     roundness_ratio = 0
     if len(femoral_head) != 0:
-        foreground_mask = (
-            np.all(femoral_head[0].mask == [255, 255, 255], axis=-1).astype(np.uint8)
-            * 255
-        )
+        foreground_mask = (femoral_head[0].mask_2d == 255).astype(np.uint8) * 255
 
         # Step 2: Detect edges
         edges = cv2.Canny(foreground_mask, 50, 150)
@@ -133,18 +133,19 @@ def get_3d_metrics_and_visuals(
         )
         hip_datas.metrics.append(c_ratio)
 
-    for name in config.hip.measurements:
+    # Gather the 2D metrics of all frames once, rather than per measurement
+    measurements = list(dict.fromkeys(config.hip.measurements))
+    values = hip_datas.metric_values(measurements)
+    sides = np.array([hip_data.side for hip_data in hip_datas], dtype=object)
+    is_post = sides == Side.POST
+    is_ant = sides == Side.ANT
+
+    for i, name in enumerate(measurements):
         if not any(metric.name == name for metric in hip_datas.metrics):
-            post_values = [
-                hip_data.get_metric(name)
-                for hip_data in hip_datas
-                if hip_data.side == Side.POST and hip_data.get_metric(name) != 0
-            ] or [0]
-            ant_values = [
-                hip_data.get_metric(name)
-                for hip_data in hip_datas
-                if hip_data.side == Side.ANT and hip_data.get_metric(name) != 0
-            ] or [0]
+            column = values[:, i]
+            recorded = column != 0
+            post_values = column[is_post & recorded].tolist() or [0]
+            ant_values = column[is_ant & recorded].tolist() or [0]
 
             graf_value = 0
             if hip_datas.graf_frame:
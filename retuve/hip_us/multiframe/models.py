@@ -346,10 +346,8 @@ def get_illium_mesh(
         ):
             illium: SegObject = illium[0]
 
-            # Convert white_points to a convenient shape for vector operations
-            midline_moved = np.array(illium.midline_moved)[
-                :, ::-1
-            ]  # Reverse each point only once
+            # Reverse each point through a view, as the midline is already an array
+            midline_moved = np.asarray(illium.midline_moved)[:, ::-1]
 
             if even_count % 2 == 0:
                 # Pick points a 10 pixel intervals on x axis
@@ -44,11 +44,13 @@ def draw_hips_xray(
 
     :return: The Drawn Images as Numpy Arrays
     """
+    # Per-frame timings are only kept in dev mode
     draw_timings = []
+    draw_start = time.perf_counter()
     image_arrays = []
 
     for hip, seg_frame_objs in zip(hip_datas, results):
-        start = time.time()
+        start = time.perf_counter()
 
         final_hip, final_seg_frame_objs, final_image = resize_data_for_display(
             hip, seg_frame_objs
@@ -65,7 +67,11 @@ def draw_hips_xray(
         img = overlay.apply_to_image(final_image)
 
         image_arrays.append(img)
-        draw_timings.append(time.time() - start)
+        if config.dev:
+            draw_timings.append(time.perf_counter() - start)
+
+    if not config.dev:
+        draw_timings = [time.perf_counter() - draw_start]
 
     log_timings(draw_timings, title="Drawing Speed:")
 
@@ -17,7 +17,7 @@ The parent class for for Retuve configs
 """
 
 import copy
-from typing import List, Tuple
+from typing import List, Literal, Tuple, Union
 
 from PIL import ImageFont
 from radstract.data.dicom import DicomTypes
@@ -53,7 +53,7 @@ class Config:
         crop_coordinates: Tuple[float],
         template: bool,
         min_seg_confidence: float,
-        device: Device,
+        device: Union[Device, Literal["auto"]],
         operation_type: OperationType,
         dev: bool,
         replace_old: bool,
@@ -73,7 +73,8 @@ class Config:
         :param crop_coordinates (Tuple[float]): The crop coordinates.
         :param template (bool): Whether this is a template config.
         :param min_seg_confidence (float): The minimum segmentation confidence.
-        :param device (Device): The device to use.
+        :param device (Device): The device to use. "auto" picks CUDA if
+                                available, otherwise CPU, on first use.
         :param operation_type (OperationType): The operation type.
         :param dev (bool): Whether to use dev mode.
         :param replace_old (bool): Whether to replace old files.
@@ -98,7 +99,7 @@ class Config:
         self.crop_coordinates = crop_coordinates
         self.min_seg_confidence = min_seg_confidence
 
-        self.device = device
+        self._device = device
         self.replace_old = replace_old
         self.operation_type = operation_type
         self.dev = dev
@@ -119,6 +120,25 @@ class Config:
         ]:
             raise ValueError(f"Invalid operation type: {operation_type}")
 
+    @property
+    def device(self) -> Device:
+        """
+        The device to use.
+
+        "auto" is resolved lazily, so that importing configs does not
+        initialise CUDA.
+        """
+        if isinstance(self._device, str) and self._device == "auto":
+            import torch
+
+            self._device = torch.device(0 if torch.cuda.is_available() else "cpu")
+
+        return self._device
+
+    @device.setter
+    def device(self, device: Union[Device, Literal["auto"]]):
+        self._device = device
+
     def register(
         self,
         name: str,
@@ -187,7 +207,12 @@ class Config:
 
         :return: A copy of the config.
         """
-        return copy.deepcopy(self)
+        # The device and fonts are never mutated in place, so share them
+        # rather than paying for a deepcopy (fonts are re-read from disk).
+        shared = (self._device, self.visuals.font_h1, self.visuals.font_h2)
+        memo = {id(obj): obj for obj in shared if obj is not None}
+
+        return copy.deepcopy(self, memo)
 
     def inject_global_config(self, username, password):
         """
@@ -220,10 +245,11 @@ class Config:
         if isinstance(name, Config):
             return name
 
-        if not cls.configs.get(name):
+        config = cls.configs.get(name)
+        if not config:
             raise ValueError(f"Config {name} does not exist.")
 
-        return cls.configs[name]
+        return config
 
     @classmethod
     def keyphrase_exists(cls, name: str) -> bool:
@@ -61,6 +61,7 @@ class HipConfig:
         graf_selection_func_args: Dict[str, Any],
         display_graf_conf: bool,
         graf_algo_threshold: float,
+        continue_on_no_metrics: bool = True,
     ):
         """
         The Hip Subconfig.
@@ -85,6 +86,9 @@ class HipConfig:
         :param graf_selection_func_args (dict): The arguments to pass to the graf, if needed.
         :param display_graf_conf (bool): Display the graf confidence.
         :param graf_algo_threshold (float): The graf algorithm confidence threshold.
+        :param continue_on_no_metrics (bool): Still draw the video and 3D visual
+                                              for a 3D US with no metrics. If False,
+                                              both are returned as None.
         """
         self.midline_color = midline_color
         self.aca_split = aca_split
@@ -106,6 +110,7 @@ class HipConfig:
         self.graf_selection_func_args = graf_selection_func_args
         self.display_graf_conf = display_graf_conf
         self.graf_algo_threshold = graf_algo_threshold
+        self.continue_on_no_metrics = continue_on_no_metrics
 
 
 class TrakConfig:
@@ -238,6 +243,7 @@ class VisualsConfig:
         display_segs: bool,
         min_vid_fps: int,
         min_vid_length: int,
+        table_backend: str = "cv2",
     ):
         """
         The Visuals Subconfig.
@@ -262,6 +268,8 @@ class VisualsConfig:
         :param display_segs (bool): Display segmentations.
         :param min_vid_fps (int): The minimum video fps.
         :param min_vid_length (int): The minimum video length
+        :param table_backend (str): How to draw the metrics table,
+                                    "cv2" (fast) or "plotly".
         """
         self.seg_color = seg_color
         self.seg_alpha = seg_alpha
@@ -280,6 +288,7 @@ class VisualsConfig:
         self.display_segs = display_segs
         self.min_vid_fps = min_vid_fps
         self.min_vid_length = min_vid_length
+        self.table_backend = table_backend
 
         self.font_h1 = font_h1
         self.font_h2 = font_h2
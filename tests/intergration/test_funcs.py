@@ -15,9 +15,12 @@
 import os
 
 import pydicom
+import pytest
 from PIL import Image
 from radstract.data.dicom import convert_dicom_to_images
 
+import retuve.funcs as funcs
+from retuve.classes.seg import SegFrameObjects
 from retuve.defaults.hip_configs import default_xray, test_default_US
 from retuve.defaults.manual_seg import (
     manual_predict_us,
@@ -30,6 +33,7 @@ from retuve.funcs import (
     analyse_hip_3DUS,
     analyse_hip_xray_2D,
     retuve_run,
+    retuve_run_stream,
 )
 from retuve.keyphrases.enums import HipMode
 
@@ -54,6 +58,37 @@ def test_analyse_hip_3DUS(us_file_path, metrics_3d_us):
     assert metrics == metrics_3d_us
 
 
+def _manual_predict_no_segs(dcm, config, **kwargs):
+    results = manual_predict_us_dcm(dcm, config, **kwargs)
+    return [SegFrameObjects.empty(img=result.img) for result in results]
+
+
+@pytest.mark.parametrize("continue_on_no_metrics", [True, False])
+def test_analyse_hip_3DUS_no_metrics(us_file_path, continue_on_no_metrics):
+    seg_file = us_file_path.replace(".dcm", ".nii.gz")
+
+    dcm = pydicom.dcmread(us_file_path)
+
+    config = test_default_US.get_copy()
+    config.hip.continue_on_no_metrics = continue_on_no_metrics
+
+    hip_datas, video_clip, visual_3d, dev_metrics = analyse_hip_3DUS(
+        dcm,
+        keyphrase=config,
+        modes_func=_manual_predict_no_segs,
+        modes_func_kwargs_dict={"seg": seg_file},
+    )
+
+    assert not any(hip.metrics for hip in hip_datas)
+    assert dev_metrics is not None
+
+    if continue_on_no_metrics:
+        assert video_clip is not None
+    else:
+        assert video_clip is None
+        assert visual_3d is None
+
+
 def test_retuve_run_3DUS(us_file_path, metrics_3d_us):
     seg_file = us_file_path.replace(".dcm", ".nii.gz")
 
@@ -99,6 +134,54 @@ def test_retuve_run_xray(landmarks_xray, xray_file_path, metrics_xray):
     assert retuve_result.metrics == metrics_xray
 
 
+def test_retuve_run_stream_xray(landmarks_xray, xray_file_path, metrics_xray):
+    retuve_results = list(
+        retuve_run_stream(
+            hip_mode=HipMode.XRAY,
+            config=default_xray,
+            modes_func=manual_predict_xray,
+            modes_func_kwargs_dict=landmarks_xray,
+            files=[xray_file_path, xray_file_path],
+        )
+    )
+
+    assert len(retuve_results) == 2
+    for retuve_result in retuve_results:
+        assert retuve_result.metrics == metrics_xray
+
+
+def test_retuve_run_stream_dispatch(monkeypatch):
+    calls = []
+
+    def fake_runner(config, modes_func, modes_func_kwargs_dict, file):
+        calls.append((config, modes_func, modes_func_kwargs_dict, file))
+        return file
+
+    monkeypatch.setitem(funcs._RUNNERS, HipMode.US2D, fake_runner)
+
+    files = ["first.jpg", "second.jpg", "third.jpg"]
+    kwargs = {"seg": "seg.nii.gz"}
+    results = list(
+        retuve_run_stream(HipMode.US2D, default_xray, manual_predict_us, kwargs, files)
+    )
+
+    # results come back in order, one runner call per file
+    assert results == files
+    assert calls == [(default_xray, manual_predict_us, kwargs, file) for file in files]
+
+    assert (
+        list(retuve_run_stream(HipMode.US2D, default_xray, manual_predict_us, {}, []))
+        == []
+    )
+
+    with pytest.raises(ValueError, match="Invalid hip_mode"):
+        list(
+            retuve_run_stream(
+                "not a hip mode", default_xray, manual_predict_us, {}, files
+            )
+        )
+
+
 def test_analyse_hip_2DUS(us_file_path, metrics_2d_us, expected_us_metrics):
 
     seg_file = us_file_path.replace(".dcm", ".nii.gz")
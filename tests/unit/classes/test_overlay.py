@@ -55,7 +55,10 @@ def test_draw_box(overlay):
 def test_draw_skeleton(overlay):
     skeleton_points = [(10, 10), (20, 20), (30, 30)]
     overlay.draw_skeleton(skeleton_points)
-    assert len(overlay.operations[DrawTypes.POINTS]) == len(skeleton_points)
+    assert len(overlay.operations[DrawTypes.POINTS]) == 1
+    assert overlay.operations[DrawTypes.POINTS][0][0][0] == [
+        (x, y) for y, x in skeleton_points
+    ]
 
 
 def test_draw_lines(overlay):
@@ -81,6 +84,38 @@ def test_apply_to_image(overlay):
     assert result.shape == (100, 100, 3)  # Should return an RGB image
 
 
+def test_apply_to_image_seg_blend(overlay):
+    points = [(10, 10), (80, 25), (60, 90), (15, 70)]
+    overlay.add_operation(DrawTypes.SEGS, points, fill=(200, 40, 0, 64))
+
+    image = np.full((100, 100, 3), 100, dtype=np.uint8)
+    result = overlay.apply_to_image(image)
+
+    # the seg covers exactly the pixels PIL's polygon would fill
+    mask = Image.new("L", (100, 100), 0)
+    ImageDraw.Draw(mask).polygon(points, fill=1)
+    region = np.asarray(mask, dtype=bool)
+
+    expected = image.copy()
+    expected[region] = [(100 * (255 - 64) + c * 64 + 127) // 255 for c in (200, 40, 0)]
+
+    assert np.array_equal(result, expected)
+
+
+def test_apply_to_image_seg_boundary(overlay):
+    points = [(5, 3), (97, 18), (71, 41), (88, 96), (12, 77), (40, 45)]
+    overlay.add_operation(DrawTypes.SEGS, points, fill=(10, 200, 30, 255))
+
+    image = np.random.default_rng(0).integers(0, 256, (100, 100, 3), np.uint8)
+    result = overlay.apply_to_image(image)
+
+    # an opaque seg matches drawing the polygon with PIL, edges included
+    expected = Image.fromarray(image)
+    ImageDraw.Draw(expected).polygon(points, fill=(10, 200, 30))
+
+    assert np.array_equal(result, np.asarray(expected))
+
+
 def test_get_nifti_frame(overlay):
     seg_frame_objs = [
         MagicMock(
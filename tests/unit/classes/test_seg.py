@@ -123,3 +123,28 @@ def test_SegFrameObjects_len():
     seg_objs = [SegObject(empty=True) for _ in range(3)]
     seg_frame_objs = SegFrameObjects(img, seg_objs)
     assert len(seg_frame_objs) == 3
+
+
+def test_SegObject_single_channel_mask():
+    mask = np.zeros((100, 100), dtype=np.uint8)
+    mask[10:20, 10:30] = 255
+
+    seg_obj = SegObject([(0, 0)], HipLabelsUS.FemoralHead, mask, box=(0, 0, 10, 10))
+
+    # mask is promoted to RGB, as a copy of the stored mask
+    assert seg_obj.mask.shape == (100, 100, 3)
+    assert np.array_equal(seg_obj.mask, create_dummy_image() * (mask[..., None] > 0))
+    assert not np.shares_memory(seg_obj.mask, mask)
+
+    # mask_2d is the stored mask itself
+    assert seg_obj.mask_2d is mask
+    assert seg_obj.area() == 200
+
+
+def test_SegObject_mask_2d_rgb():
+    mask = create_dummy_image()
+    seg_obj = SegObject([(0, 0)], HipLabelsUS.FemoralHead, mask, box=(0, 0, 10, 10))
+
+    assert seg_obj.mask_2d.shape == (100, 100)
+    assert np.shares_memory(seg_obj.mask_2d, mask)
+    assert np.all(seg_obj.mask_2d == 255)
@@ -0,0 +1,68 @@
+# Copyright 2024 Adam McArthur
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from retuve.classes.metrics import Metric2D, Metric3D
+from retuve.hip_us.classes.enums import Side
+from retuve.hip_us.classes.general import HipDatasUS, HipDataUS, LandmarksUS
+
+
+def _make_hip_datas() -> HipDatasUS:
+    hip_datas = HipDatasUS()
+    for frame_no in range(3):
+        hip_datas.append(
+            HipDataUS(
+                landmarks=LandmarksUS(left=(10, 20), right=(90, 20), apex=(60, 30)),
+                metrics=[Metric2D("alpha", 60.0 + frame_no)],
+                frame_no=frame_no,
+            )
+        )
+
+    hip_datas.metrics = [Metric3D("alpha", post=60.0, graf=61.0, ant=62.0)]
+    hip_datas.cr_points = [1.0]
+    hip_datas.recorded_error.append("First error.")
+
+    return hip_datas
+
+
+def test_snapshot_unaffected_by_later_edits():
+    hip_datas = _make_hip_datas()
+    snapshot = hip_datas.snapshot()
+
+    # edit the original in the ways the pipeline does later on
+    hip_datas[0].landmarks.apex = (0, 0)
+    hip_datas[0].metrics.append(Metric2D("coverage", 0.5))
+    hip_datas[1].side = Side.ANT
+    hip_datas[1].frame_no = 10
+    hip_datas[2] = HipDataUS(frame_no=2)
+    hip_datas.append(HipDataUS(frame_no=3))
+    hip_datas.metrics.append(Metric3D("aca", full=12.0))
+    hip_datas.cr_points.append(2.0)
+    hip_datas.recorded_error.append("Second error.")
+    hip_datas.recorded_error.critical = True
+
+    expected = _make_hip_datas()
+
+    assert len(snapshot) == len(expected)
+    for snap_hip, expected_hip in zip(snapshot, expected):
+        assert tuple(snap_hip.landmarks) == tuple(expected_hip.landmarks)
+        assert [(m.name, m.value) for m in snap_hip.metrics] == [
+            (m.name, m.value) for m in expected_hip.metrics
+        ]
+        assert snap_hip.frame_no == expected_hip.frame_no
+        assert snap_hip.side is None
+
+    assert [m.dump() for m in snapshot.metrics] == [m.dump() for m in expected.metrics]
+    assert snapshot.cr_points == [1.0]
+    assert snapshot.recorded_error.errors == ["First error."]
+    assert not snapshot.recorded_error.critical
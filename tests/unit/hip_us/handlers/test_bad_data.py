@@ -12,9 +12,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import pytest
 from cv2 import exp
 
+from retuve.classes.metrics import Metric2D
+from retuve.hip_us.classes.general import HipDatasUS, HipDataUS
 from retuve.hip_us.handlers.bad_data import handle_bad_frames, remove_outliers
+from retuve.keyphrases.enums import HipMode
 
 
 def test_remove_outliers(edited_hips, expected_us_metrics):
@@ -29,6 +33,55 @@ def test_remove_outliers(edited_hips, expected_us_metrics):
     ), f"Outliers not removed correctly {keep}"
 
 
+def _windowed_outliers(pred_made):
+    # The original sliding window, summing every window of size total_true
+    total_true = sum(pred_made)
+
+    max_true = 0
+    max_true_index = 0
+    for i in range(len(pred_made) - total_true + 1):
+        current_window_true = sum(pred_made[i : i + total_true])
+        if current_window_true > max_true:
+            max_true = current_window_true
+            max_true_index = i
+
+    keep = [False] * len(pred_made)
+    for i in range(max_true_index, max_true_index + total_true):
+        if pred_made[i]:
+            keep[i] = True
+
+    return keep
+
+
+@pytest.mark.parametrize(
+    "pred_made",
+    [
+        # short lists
+        [],
+        [False],
+        [True],
+        [True, False],
+        # a single run of marked frames, which returns early
+        [True, True],
+        [False, True, True, False],
+        # outliers either side of the main run
+        [True, False, False, True, True, True, False, True],
+        [False, True, True, True, True, False, False, False, True],
+        [True, False, True, False, True, False],
+    ],
+)
+def test_remove_outliers_matches_window(pred_made):
+    hip_datas = HipDatasUS()
+    for frame_no, marked in enumerate(pred_made):
+        metrics = [Metric2D("alpha", 60.0 if marked else 0)]
+        hip_datas.append(HipDataUS(metrics=metrics, frame_no=frame_no))
+
+    keep = remove_outliers(hip_datas, {})
+
+    assert keep == _windowed_outliers(pred_made)
+    assert all(type(kept) is bool for kept in keep)
+
+
 def test_handle_bad_frames(edited_hips, expected_us_metrics, config_us):
 
     result = handle_bad_frames(edited_hips, config_us)
@@ -45,3 +98,24 @@ def test_handle_bad_frames(edited_hips, expected_us_metrics, config_us):
         result[idx_results].frame_no == idx_results
         and result[idx_results].metrics is not None
     )
+
+
+def test_handle_bad_frames_short_rejection_reasons(config_us):
+    config = config_us.get_copy()
+    config.batch.hip_mode = HipMode.US2DSW
+
+    hip_datas = HipDatasUS()
+    for frame_no in range(3):
+        hip_datas.append(HipDataUS(frame_no=frame_no))
+
+    # fewer rejection reasons than frames
+    hip_datas.all_seg_rejection_reasons = [["Femoral Head too small"]]
+
+    result = handle_bad_frames(hip_datas, config)
+
+    assert [hip.frame_no for hip in result] == [0, 1, 2]
+    assert result.bad_frame_reasons == {
+        0: "Femoral Head too small",
+        1: "Not Enough Data",
+        2: "Not Enough Data",
+    }
@@ -14,6 +14,7 @@
 
 import copy
 
+from retuve.hip_us.classes.dev import DevMetricsUS, DevMetricsUSBatch
 from retuve.hip_us.classes.general import HipDatasUS
 from retuve.hip_us.metrics.dev import get_dev_metrics
 
@@ -60,3 +61,33 @@ def test_get_dev_metrics_execution(hip_datas_us, results_us, config_us):
         hip_datas_before.dev_metrics.total_frames
         == hip_datas_us.dev_metrics.total_frames
     )
+
+
+def test_dev_metrics_us_batch_summary():
+    """
+    Test that DevMetricsUSBatch summarises a list of DevMetricsUS.
+    """
+    dev_metrics_list = []
+    for i in range(4):
+        dev_metrics = DevMetricsUS()
+        dev_metrics.no_frames_segmented = i
+        dev_metrics.no_frames_marked = 2 * i
+        dev_metrics.total_frames = 10
+        dev_metrics.critial_error = i % 2 == 0
+        dev_metrics.graf_frame = None if i == 0 else i
+        dev_metrics_list.append(dev_metrics)
+
+    batch = DevMetricsUSBatch(dev_metrics_list)
+
+    assert len(batch) == 4
+    assert batch.graf_frame.tolist() == [0, 1, 2, 3]
+    assert batch.summary() == {
+        "count": 4,
+        "os_ichium_detected": 0,
+        "critial_error": 2,
+        "mean_no_frames_segmented": 1.5,
+        "mean_no_frames_marked": 3.0,
+        "mean_total_frames": 10.0,
+        "total_frames": 40,
+    }
+    assert DevMetricsUSBatch([]).summary() == {}
@@ -12,10 +12,24 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from unittest.mock import MagicMock
+
 import numpy as np
+import pytest
+from radstract.data.nifti import convert_images_to_nifti_labels
 
 from retuve.classes.draw import Overlay
-from retuve.hip_us.draw import draw_fem_head, draw_hips_us, draw_table
+from retuve.classes.metrics import Metric3D
+from retuve.draw import TARGET_SIZE, contain_size
+from retuve.hip_us.classes.enums import HipLabelsUS
+from retuve.hip_us.classes.general import HipDatasUS
+from retuve.hip_us.draw import (
+    _draw_nifti_labels,
+    _labels_to_nifti,
+    draw_fem_head,
+    draw_hips_us,
+    draw_table,
+)
 
 
 def test_draw_fem_head(hip_data_us_0, fem_sph, config_us):
@@ -39,3 +53,60 @@ def test_draw_table(hip_datas_us, img_shape_us):
 
     assert isinstance(image, np.ndarray)
     assert image.shape == (img_shape_us[0], img_shape_us[1], 3)
+
+
+@pytest.mark.parametrize("table_backend", ["cv2", "plotly"])
+def test_draw_table_backends(config_us, table_backend):
+    config = config_us.get_copy()
+    config.visuals.table_backend = table_backend
+
+    hip_datas = HipDatasUS()
+    hip_datas.metrics = [
+        Metric3D("alpha", post=58.2, graf=61.5, ant=60.0),
+        Metric3D("aca", full=12.3),
+    ]
+    hip_datas.recorded_error.append("Test error.")
+
+    image = draw_table((640, 480), hip_datas, config)
+
+    assert isinstance(image, np.ndarray)
+    assert image.dtype == np.uint8
+    assert image.shape == (*contain_size(640, 480, TARGET_SIZE), 3)
+
+
+def test_labels_to_nifti_matches_radstract(config_us):
+    height, width = 90, 120
+    rng = np.random.default_rng(0)
+
+    frames = []
+    for _ in range(5):
+        seg_frame_objs = [
+            MagicMock(
+                empty=False,
+                points=[tuple(p) for p in rng.integers(0, 120, (6, 2)).tolist()],
+                cls=cls,
+            )
+            for cls in HipLabelsUS
+        ]
+        seg_frame_objs.append(MagicMock(empty=True))
+        frames.append(seg_frame_objs)
+
+    # the previous path, through coloured images and radstract
+    overlay = Overlay((height, width, 3), config_us)
+    expected = convert_images_to_nifti_labels(
+        [overlay.get_nifti_frame(objs, (width, height)) for objs in frames]
+    )
+
+    labels = np.zeros((len(frames), height, width), dtype=np.uint16)
+    for seg_frame_objs, labels_slice in zip(frames, labels):
+        _draw_nifti_labels(seg_frame_objs, labels_slice)
+    nifti = _labels_to_nifti(labels)
+
+    expected_data = np.asarray(expected.image.dataobj)
+    data = np.asarray(nifti.image.dataobj)
+
+    assert len(np.unique(data)) > 1
+    assert data.shape == expected_data.shape
+    assert np.array_equal(data, expected_data)
+    assert np.array_equal(nifti.image.affine, expected.image.affine)
+    assert nifti.type == expected.type